@@ -27,6 +27,8 @@ Kullanım örnekleri:
 
 Gereksinimler (pip):
   pip install requests beautifulsoup4 lxml tldextract
+  pip install selectolax   # opsiyonel: çok daha hızlı HTML ayrıştırma
+  pip install aiohttp      # opsiyonel: sitemap modunda asenkron, yüksek eşzamanlı indirme
 
 Notlar:
 - Bu araç Core Web Vitals ölçmez; ancak yanıt süresi gibi basit göstergeler sağlar.
@@ -35,21 +37,36 @@ Notlar:
 
 import argparse
 import csv
+import heapq
 import json
 import re
 import sys
 import time
-import tldextract
-from collections import deque, Counter
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from html import unescape
-from io import BytesIO
-from typing import Dict, List, Optional, Set, Tuple
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from importlib.util import find_spec
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse
 from urllib import robotparser
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# selectolax (Lexbor) isteğe bağlı; yoksa BeautifulSoup + lxml kullanılır
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# aiohttp isteğe bağlı; yoksa sitemap URL'leri thread havuzuyla çekilir.
+# Açılışı yavaşlatmaması için yalnızca kullanıldığı yerde import edilir
+# (tldextract, bs4 ve lxml de aynı şekilde).
+AIOHTTP_AVAILABLE = find_spec("aiohttp") is not None
 
 HEADERS = {
     "User-Agent": (
@@ -60,11 +77,80 @@ HEADERS = {
 }
 TIMEOUT = 15
 MAX_WORKERS = 8
+ASYNC_CONCURRENCY = 32
+MAX_BODY_BYTES = 4_000_000  # sayfa başına okunacak azami gövde boyutu
+CHUNK_SIZE = 65536
+PARSE_POOL_MIN_JOBS = 32  # bundan az sayfa süreç havuzu açılmadan ayrıştırılır
 
-RECOMMENDED_TITLE = (50, 60)  # yaklaşık karakter aralığı
-RECOMMENDED_DESC = (120, 160)
+# Tüm istekler tek oturumu paylaşır; keep-alive ile TCP/TLS el sıkışması tekrar edilmez
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.max_redirects = 10
+_SESSION.mount("http://", HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS * 2))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS * 2))
 
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
 
+RECOMMENDED_TITLE = (50, 60)  # yaklaşık karakter aralığı
+RECOMMENDED_DESC = (120, 160)
+THIN_WORDS = 300
+
+# Sayfa başına tekrar derlenmemesi için modül seviyesinde derlenmiş desenler
+_RE_WS = re.compile(r"\s+")
+_RE_DESC = re.compile(r"^description$", re.I)
+_RE_ROBOTS = re.compile(r"^robots$", re.I)
+_RE_OG = re.compile(r"^og:", re.I)
+_RE_TW = re.compile(r"^twitter:", re.I)
+_RE_CANON = re.compile(r"canonical")
+_RE_ALT = re.compile(r"alternate")
+_RE_NOFOLLOW = re.compile(r"\bnofollow\b", re.I)
+_RE_HEADING = re.compile(r"^h[1-6]$")
+_RE_WORD = re.compile(r"\S+")
+
+
+# slots=True Python 3.10+ ister; daha eski yorumlayıcılarda satır sınıfı __dict__ ile tanımlanır (içe aktarma bozulmaz)
+_ROW_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_ROW_SLOTS)
+class PageRow:
+    url: str
+    status: int
+    resp_ms: int
+    redirects: str = ""
+    bytes_kb: float = 0.0
+    title: str = ""
+    title_len: int = 0
+    title_ok: bool = False
+    meta_desc: str = ""
+    meta_desc_len: int = 0
+    meta_desc_ok: bool = False
+    meta_robots: str = ""
+    canonical: str = ""
+    self_canonical: bool = False
+    h1_count: int = 0
+    h1_texts: str = ""
+    h2_count: int = 0
+    h3_count: int = 0
+    h4_count: int = 0
+    h5_count: int = 0
+    h6_count: int = 0
+    img_total: int = 0
+    img_missing_alt: int = 0
+    links_internal: int = 0
+    links_external: int = 0
+    links_nofollow: int = 0
+    open_graph: bool = False
+    twitter_card: bool = False
+    hreflang_count: int = 0
+    jsonld_types: str = ""
+    word_count: int = 0
+
+
+PAGE_FIELDS = [f.name for f in fields(PageRow)]
+
+
+@lru_cache(maxsize=8192)
 def normalize_url(base: str, href: str) -> Optional[str]:
     if not href:
         return None
@@ -81,46 +167,130 @@ def normalize_url(base: str, href: str) -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=1)
+def _tld_extractor():
+    # Paketle gelen PSL kopyası kullanılır: ağ isteği yok, disk önbelleği yok
+    import tldextract
+    return tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None, include_psl_private_domains=False)
+
+
+@lru_cache(maxsize=4096)
+def _reg_domain(netloc: str) -> Tuple[str, str]:
+    # Aynı netloc için public suffix listesine tekrar tekrar bakmamak için önbellekli
+    e = _tld_extractor()(netloc)
+    return (e.domain, e.suffix)
+
+
 def same_domain(a: str, b: str) -> bool:
-    ea = tldextract.extract(a)
-    eb = tldextract.extract(b)
-    return (ea.domain, ea.suffix) == (eb.domain, eb.suffix)
+    return _reg_domain(urlparse(a).netloc) == _reg_domain(urlparse(b).netloc)
 
 
 def fetch(url: str) -> Tuple[requests.Response, List[str], float]:
-    session = requests.Session()
-    session.max_redirects = 10
     redirects = []
     t0 = time.time()
     try:
-        resp = session.get(url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=True)
+        resp = _SESSION.get(url, timeout=TIMEOUT, allow_redirects=True, stream=True)
+        try:
+            resp._content = _read_capped(resp)
+        finally:
+            resp.close()
         for h in resp.history:
             redirects.append(h.url)
         elapsed_ms = int((time.time() - t0) * 1000)
         return resp, redirects, elapsed_ms
     except Exception as e:
         elapsed_ms = int((time.time() - t0) * 1000)
-        dummy = requests.Response()
-        dummy.status_code = 0
-        dummy._content = str(e).encode("utf-8", errors="ignore")
-        dummy.url = url
-        return dummy, redirects, elapsed_ms
+        return _error_response(url, e), redirects, elapsed_ms
+
+
+def _is_html(headers) -> bool:
+    return headers.get("Content-Type", "").lower().startswith("text/html")
+
+
+def _read_capped(resp: requests.Response) -> bytes:
+    # HTML olmayan gövdeler hiç okunmaz, HTML ise MAX_BODY_BYTES ile sınırlanır
+    if not _is_html(resp.headers):
+        return b""
+    chunks = []
+    total = 0
+    for c in resp.iter_content(CHUNK_SIZE):
+        chunks.append(c)
+        total += len(c)
+        if total > MAX_BODY_BYTES:
+            break
+    return b"".join(chunks)
+
+
+def _error_response(url: str, exc: Exception) -> requests.Response:
+    dummy = requests.Response()
+    dummy.status_code = 0
+    dummy._content = str(exc).encode("utf-8", errors="ignore")
+    dummy.url = url
+    return dummy
+
+
+async def afetch(client, url: str) -> Tuple[requests.Response, List[str], int]:
+    # fetch() ile aynı çıktıyı verir; aiohttp yanıtı requests.Response'a aktarılır
+    redirects = []
+    t0 = time.time()
+    try:
+        async with client.get(url, allow_redirects=True, max_redirects=10) as r:
+            chunks = []
+            total = 0
+            if _is_html(r.headers):
+                async for c in r.content.iter_chunked(CHUNK_SIZE):
+                    chunks.append(c)
+                    total += len(c)
+                    if total > MAX_BODY_BYTES:
+                        break
+            content = b"".join(chunks)
+            redirects = [str(h.url) for h in r.history]
+            resp = requests.Response()
+            resp.status_code = r.status
+            resp._content = content
+            resp.url = str(r.url)
+            resp.headers = CaseInsensitiveDict(r.headers)
+        elapsed_ms = int((time.time() - t0) * 1000)
+        return resp, redirects, elapsed_ms
+    except Exception as e:
+        elapsed_ms = int((time.time() - t0) * 1000)
+        return _error_response(url, e), redirects, elapsed_ms
+
 
+async def _afetch_all(urls: List[str]) -> List[Tuple[requests.Response, List[str], int]]:
+    # asyncio ve aiohttp yalnızca sitemap modunda gerekir; açılışta yüklenmez
+    import asyncio
+    import aiohttp
+    sem = asyncio.Semaphore(ASYNC_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=TIMEOUT)
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as client:
+        async def one(u: str):
+            async with sem:
+                return await afetch(client, u)
+        return await asyncio.gather(*(one(u) for u in urls))
 
-def visible_text(soup: BeautifulSoup) -> str:
-    for tag in soup(["script", "style", "noscript", "template", "svg", "meta", "link"]):
-        tag.decompose()
-    text = soup.get_text(separator=" ")
-    text = unescape(text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
 
+SKIP_TAGS = ["script", "style", "noscript", "template", "svg", "meta", "link"]
 
-def extract_jsonld_types(soup: BeautifulSoup) -> List[str]:
+
+def visible_word_count(doc) -> int:
+    # Görünen metin normalize edilip saklanmaz; kelimeler ham metin üzerinde sayılır
+    if SELECTOLAX_AVAILABLE and isinstance(doc, LexborHTMLParser):
+        for node in doc.css(",".join(SKIP_TAGS)):
+            node.decompose()
+        text = doc.root.text(separator=" ") if doc.root else ""
+    else:
+        for tag in doc(SKIP_TAGS):
+            tag.decompose()
+        text = doc.get_text(separator=" ")
+    return sum(1 for _ in _RE_WORD.finditer(text))
+
+
+def extract_jsonld_types(scripts: List[str]) -> List[str]:
     types = []
-    for s in soup.find_all("script", type=lambda t: t and "ld+json" in t):
+    for raw in scripts:
         try:
-            data = json.loads(s.string or s.text or "{}")
+            data = json.loads(raw or "{}")
             def collect(d):
                 if isinstance(d, dict):
                     t = d.get("@type")
@@ -141,96 +311,211 @@ def extract_jsonld_types(soup: BeautifulSoup) -> List[str]:
     return uniq[:10]
 
 
-def parse_page(url: str, html: bytes, status: int, elapsed_ms: int, redirects: List[str]) -> Dict:
-    soup = BeautifulSoup(html, "lxml")
+def _decode_html(html: bytes) -> str:
+    # Lexbor ham baytlarda <meta charset> bildirimine bakmaz; metin önce çözülür.
+    # Geçerli UTF-8 hızlı yoldan geçer (baştaki BOM atılır; yoksa ayrı bir "kelime" sayılır),
+    # diğerleri (ör. windows-1254) bs4 ile aynı tespitten geçer
+    try:
+        return html.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        pass
+    from bs4.dammit import UnicodeDammit
+    markup = UnicodeDammit(html, is_html=True).unicode_markup
+    return markup if markup is not None else html.decode("utf-8-sig", errors="replace")
+
+
+def parse_html(html: bytes):
+    if SELECTOLAX_AVAILABLE:
+        return LexborHTMLParser(_decode_html(html))
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, "lxml")
+
+
+def _page_parts_lexbor(tree) -> Dict:
+    title_tag = tree.css_first("title")
+    title = title_tag.text().strip() if title_tag else ""
+    meta_desc_tag = tree.css_first('meta[name="description" i]')
+    meta_desc = (meta_desc_tag.attributes.get("content") or "").strip() if meta_desc_tag else ""
+    meta_robots_tag = tree.css_first('meta[name="robots" i]')
+    meta_robots = (meta_robots_tag.attributes.get("content") or "").strip() if meta_robots_tag else ""
+    canonical_tag = tree.css_first('link[rel~="canonical"]')
+    canonical = (canonical_tag.attributes.get("href") or "").strip() if canonical_tag else ""
+
+    # H1-H6 tek geçişte sayılır
+    h_counts = {f"h{lvl}": 0 for lvl in range(1, 7)}
+    h1_texts: List[str] = []
+    for node in tree.css("h1,h2,h3,h4,h5,h6"):
+        tag = node.tag
+        h_counts[tag] += 1
+        if tag == "h1":
+            h1_texts.append(_RE_WS.sub(" ", node.text(strip=True)))
+
+    imgs = tree.css("img")
+    # (href, nofollow mu) çiftleri; Lexbor'da rel zaten tek bir dizge
+    nf = _RE_NOFOLLOW.search
+    anchors = []
+    for a in tree.css("a[href]"):
+        attrs = a.attributes
+        rel = attrs.get("rel")
+        anchors.append((attrs.get("href") or "", bool(rel and nf(rel))))
+
+    return {
+        "title": title,
+        "meta_desc": meta_desc,
+        "meta_robots": meta_robots,
+        "canonical": canonical,
+        "h_counts": h_counts,
+        "h1_texts": h1_texts,
+        "img_total": len(imgs),
+        "img_missing_alt": sum(1 for i in imgs if not i.attributes.get("alt")),
+        "anchors": anchors,
+        "open_graph": tree.css_first('meta[property^="og:" i]') is not None,
+        "twitter_card": tree.css_first('meta[name^="twitter:" i]') is not None,
+        "hreflang_count": len(tree.css('link[rel~="alternate"][hreflang]')),
+        "jsonld": [s.text() for s in tree.css('script[type*="ld+json"]')],
+        "word_count": visible_word_count(tree),
+    }
+
+
+def _page_parts_bs4(soup) -> Dict:
     title = (soup.title.string.strip() if soup.title and soup.title.string else "")
-    meta_desc_tag = soup.find("meta", attrs={"name": re.compile(r"^description$", re.I)})
+    meta_desc_tag = soup.find("meta", attrs={"name": _RE_DESC})
     meta_desc = meta_desc_tag.get("content", "").strip() if meta_desc_tag else ""
-    meta_robots_tag = soup.find("meta", attrs={"name": re.compile(r"^robots$", re.I)})
+    meta_robots_tag = soup.find("meta", attrs={"name": _RE_ROBOTS})
     meta_robots = meta_robots_tag.get("content", "").strip() if meta_robots_tag else ""
-
-    canonical_tag = soup.find("link", rel=lambda v: v and "canonical" in v)
+    canonical_tag = soup.find("link", rel=_RE_CANON)
     canonical = canonical_tag.get("href", "").strip() if canonical_tag else ""
-    self_canonical = canonical.lower().rstrip("/") == url.lower().rstrip("/") if canonical else False
 
-    h_counts = {}
-    h_texts = {"h1": []}
-    for lvl in [1, 2, 3, 4, 5, 6]:
-        tags = soup.find_all(f"h{lvl}")
-        h_counts[f"h{lvl}"] = len(tags)
-        if lvl == 1:
-            h_texts["h1"] = [re.sub(r"\s+", " ", t.get_text(strip=True)) for t in tags]
+    h_counts = {f"h{lvl}": 0 for lvl in range(1, 7)}
+    h1_texts: List[str] = []
+    for tag in soup.find_all(_RE_HEADING):
+        h_counts[tag.name] += 1
+        if tag.name == "h1":
+            h1_texts.append(_RE_WS.sub(" ", tag.get_text(strip=True)))
 
     imgs = soup.find_all("img")
-    img_total = len(imgs)
-    img_missing_alt = sum(1 for i in imgs if not i.get("alt"))
+    anchors = []
+    for a in soup.find_all("a", href=True):
+        rel = a.get("rel")
+        if not rel:
+            is_nf = False
+        elif isinstance(rel, list):
+            is_nf = any(r.lower() == "nofollow" for r in rel)
+        else:
+            is_nf = bool(_RE_NOFOLLOW.search(rel))
+        anchors.append((a["href"], is_nf))
+
+    return {
+        "title": title,
+        "meta_desc": meta_desc,
+        "meta_robots": meta_robots,
+        "canonical": canonical,
+        "h_counts": h_counts,
+        "h1_texts": h1_texts,
+        "img_total": len(imgs),
+        "img_missing_alt": sum(1 for i in imgs if not i.get("alt")),
+        "anchors": anchors,
+        "open_graph": bool(soup.find("meta", property=_RE_OG)),
+        "twitter_card": bool(soup.find("meta", attrs={"name": _RE_TW})),
+        "hreflang_count": len(soup.find_all("link", rel=_RE_ALT, hreflang=True)),
+        "jsonld": [s.string or s.text for s in soup.find_all("script", type=lambda t: t and "ld+json" in t)],
+        "word_count": visible_word_count(soup),
+    }
+
+
+def page_parts(doc) -> Dict:
+    return _page_parts_lexbor(doc) if SELECTOLAX_AVAILABLE else _page_parts_bs4(doc)
+
+
+def parse_page(url: str, html: bytes, status: int, elapsed_ms: int, redirects: List[str], parts: Optional[Dict] = None) -> PageRow:
+    # parts verilirse (crawl sırasında aynı ağaçtan zaten çıkarıldı) HTML tekrar ayrıştırılmaz
+    if parts is None:
+        parts = page_parts(parse_html(html))
+    title = parts["title"]
+    meta_desc = parts["meta_desc"]
+    meta_robots = parts["meta_robots"]
+    canonical = parts["canonical"]
+    self_canonical = canonical.lower().rstrip("/") == url.lower().rstrip("/") if canonical else False
+    h_counts = parts["h_counts"]
 
-    links = soup.find_all("a", href=True)
     internal = external = nofollow = 0
-    domain = urlparse(url).netloc
-    for a in links:
-        href = normalize_url(url, a["href"]) or ""
+    page_reg = _reg_domain(urlparse(url).netloc)
+    # Sıcak döngü: global aramalar yerel isimlere bağlanır
+    _norm, _reg, _parse = normalize_url, _reg_domain, urlparse
+    for raw_href, is_nf in parts["anchors"]:
+        href = _norm(url, raw_href) or ""
         if not href:
             continue
-        if same_domain(url, href):
+        if _reg(_parse(href).netloc) == page_reg:
             internal += 1
         else:
             external += 1
-        rel = (a.get("rel") or [])
-        if isinstance(rel, list):
-            rel = " ".join(rel)
-        if "nofollow" in (rel or "").lower():
+        if is_nf:
             nofollow += 1
 
-    og_present = bool(soup.find("meta", property=re.compile(r"^og:", re.I)))
-    tw_present = bool(soup.find("meta", attrs={"name": re.compile(r"^twitter:", re.I)}))
-    hreflangs = [l.get("href") for l in soup.find_all("link", rel=lambda v: v and "alternate" in v, hreflang=True)]
-    jsonld_types = extract_jsonld_types(soup)
+    jsonld_types = extract_jsonld_types(parts["jsonld"])
+    word_count = parts["word_count"]
+
+    return PageRow(
+        url=url,
+        status=status,
+        resp_ms=elapsed_ms,
+        redirects=" -> ".join(redirects) if redirects else "",
+        bytes_kb=round(len(html) / 1024.0, 1),
+        title=title,
+        title_len=len(title),
+        title_ok=RECOMMENDED_TITLE[0] <= len(title) <= RECOMMENDED_TITLE[1],
+        meta_desc=meta_desc,
+        meta_desc_len=len(meta_desc),
+        meta_desc_ok=RECOMMENDED_DESC[0] <= len(meta_desc) <= RECOMMENDED_DESC[1],
+        meta_robots=meta_robots,
+        canonical=canonical,
+        self_canonical=self_canonical,
+        h1_count=h_counts.get("h1", 0),
+        h1_texts=" | ".join(parts["h1_texts"][:5]),
+        h2_count=h_counts.get("h2", 0),
+        h3_count=h_counts.get("h3", 0),
+        h4_count=h_counts.get("h4", 0),
+        h5_count=h_counts.get("h5", 0),
+        h6_count=h_counts.get("h6", 0),
+        img_total=parts["img_total"],
+        img_missing_alt=parts["img_missing_alt"],
+        links_internal=internal,
+        links_external=external,
+        links_nofollow=nofollow,
+        open_graph=parts["open_graph"],
+        twitter_card=parts["twitter_card"],
+        hreflang_count=parts["hreflang_count"],
+        jsonld_types=", ".join(jsonld_types),
+        word_count=word_count,
+    )
 
-    text = visible_text(soup)
-    word_count = len(text.split())
 
-    return {
-        "url": url,
-        "status": status,
-        "resp_ms": elapsed_ms,
-        "redirects": " -> ".join(redirects) if redirects else "",
-        "bytes_kb": round(len(html) / 1024.0, 1),
-        "title": title,
-        "title_len": len(title),
-        "title_ok": RECOMMENDED_TITLE[0] <= len(title) <= RECOMMENDED_TITLE[1],
-        "meta_desc": meta_desc,
-        "meta_desc_len": len(meta_desc),
-        "meta_desc_ok": RECOMMENDED_DESC[0] <= len(meta_desc) <= RECOMMENDED_DESC[1],
-        "meta_robots": meta_robots,
-        "canonical": canonical,
-        "self_canonical": self_canonical,
-        "h1_count": h_counts.get("h1", 0),
-        "h1_texts": " | ".join(h_texts.get("h1", [])[:5]),
-        "h2_count": h_counts.get("h2", 0),
-        "h3_count": h_counts.get("h3", 0),
-        "h4_count": h_counts.get("h4", 0),
-        "h5_count": h_counts.get("h5", 0),
-        "h6_count": h_counts.get("h6", 0),
-        "img_total": img_total,
-        "img_missing_alt": img_missing_alt,
-        "links_internal": internal,
-        "links_external": external,
-        "links_nofollow": nofollow,
-        "open_graph": og_present,
-        "twitter_card": tw_present,
-        "hreflang_count": len(hreflangs),
-        "jsonld_types": ", ".join(jsonld_types),
-        "word_count": word_count,
-    }
+def iter_sitemap_locs(fp) -> Iterator[str]:
+    from lxml import etree
+    loc_tags = (f"{SITEMAP_NS}loc", "loc")
+    # <url>/<sitemap> kapanınca alt ağacıyla birlikte kökten koparılır; bellek girdi sayısıyla büyümez
+    entry_tags = (f"{SITEMAP_NS}url", "url", f"{SITEMAP_NS}sitemap", "sitemap")
+    # recover: CMS'lerin kaçışsız '&' gibi hatalarında ayrıştırma durmaz (bs4 "xml" gibi); huge_tree: çok büyük dosyalar
+    for _, el in etree.iterparse(fp, tag=loc_tags + entry_tags, recover=True, huge_tree=True):
+        if el.tag in loc_tags:
+            if el.text and el.text.strip():
+                yield el.text.strip()
+            continue
+        el.clear()
+        parent = el.getparent()
+        if parent is not None:
+            while el.getprevious() is not None:
+                del parent[0]
 
 
 def load_sitemap(url: str) -> List[str]:
     try:
-        r = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-        r.raise_for_status()
-        soup = BeautifulSoup(r.content, "xml")
-        locs = [loc.get_text(strip=True) for loc in soup.find_all("loc")]
+        # Büyük sitemap'ler belleğe alınmadan akış halinde ayrıştırılır
+        with _SESSION.get(url, timeout=TIMEOUT, stream=True) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True
+            locs = list(iter_sitemap_locs(r.raw))
         return list(dict.fromkeys(locs))
     except Exception as e:
         print(f"[!] Sitemap okunamadı: {e}")
@@ -249,107 +534,218 @@ def get_robots_parser(start_url: str) -> robotparser.RobotFileParser:
     return rp
 
 
-def crawl(start: str, max_pages: int, same_site_only: bool = True) -> List[str]:
+def crawl(start: str, max_pages: int, same_site_only: bool = True) -> List[Tuple[str, requests.Response, List[str], int, PageRow]]:
     visited: Set[str] = set()
-    q = deque([start])
-    base_host = urlparse(start).netloc
+    # Her URL kuyruğa yalnızca bir kez girer (menü linkleri her sayfada tekrar eder)
+    enqueued: Set[str] = {start}
+    frontier = [start]
     rp = get_robots_parser(start)
+    start_reg = _reg_domain(urlparse(start).netloc)
 
-    results = []
-    while q and len(visited) < max_pages:
-        url = q.popleft()
-        if url in visited:
-            continue
-        visited.add(url)
-
-        # robots izin kontrolü
-        if not rp.can_fetch(HEADERS["User-Agent"], url):
-            continue
+    @lru_cache(maxsize=8192)
+    def _can_fetch(target: str) -> bool:
+        return rp.can_fetch(HEADERS["User-Agent"], target)
 
-        try:
-            resp, redirects, elapsed_ms = fetch(url)
-            results.append((url, resp, redirects, elapsed_ms))
-            if resp.status_code == 200 and resp.headers.get("Content-Type", "").lower().startswith("text/html"):
-                soup = BeautifulSoup(resp.content, "lxml")
-                for a in soup.find_all("a", href=True):
-                    href = normalize_url(url, a["href"]) or ""
+    _norm, _reg, _parse = normalize_url, _reg_domain, urlparse
+    results = []
+    # Seviye seviye BFS: her seviyedeki URL'ler aynı havuzda eşzamanlı çekilir
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        while frontier and len(visited) < max_pages:
+            batch = []
+            for url in frontier:
+                if len(visited) >= max_pages:
+                    break
+                if url in visited:
+                    continue
+                visited.add(url)
+                # robots izin kontrolü (kurallar yalnızca path/query'ye bakar)
+                p = urlparse(url)
+                if _can_fetch(urlunparse(("", "", p.path, p.params, p.query, ""))):
+                    batch.append(url)
+
+            next_frontier: List[str] = []
+            futs = {ex.submit(fetch, u): u for u in batch}
+            for fut in as_completed(futs):
+                url = futs[fut]
+                try:
+                    resp, redirects, elapsed_ms = fut.result()
+                except Exception:
+                    continue
+                if not (resp.status_code == 200 and _is_html(resp.headers)):
+                    row = empty_row(url, resp.content or b"", resp.status_code, elapsed_ms, redirects)
+                    resp._content = b""
+                    results.append((url, resp, redirects, elapsed_ms, row))
+                    continue
+                # HTML bir kez ayrıştırılır ve tek geçişte gezilir: linkler satır için toplanan anchor'lardan alınır.
+                # Satır hemen üretilir ve ağaç bırakılır (ağaçlar tarama boyunca tutulmaz)
+                hrefs: List[str] = []
+                try:
+                    parts = page_parts(parse_html(resp.content))
+                    hrefs = [h for h, _ in parts["anchors"]]
+                    row = _parse_worker((url, resp.content, resp.status_code, elapsed_ms, redirects, True), parts)
+                except Exception:
+                    row = empty_row(url, resp.content, resp.status_code, elapsed_ms, redirects)
+                # Her yanıtın satırı burada kurulur; gövde artık gerekmez ve sonuçlarla birlikte tutulmaz
+                resp._content = b""
+                results.append((url, resp, redirects, elapsed_ms, row))
+                for raw_href in hrefs:
+                    href = _norm(url, raw_href) or ""
                     if not href:
                         continue
-                    if same_site_only and not same_domain(start, href):
+                    if same_site_only and _reg(_parse(href).netloc) != start_reg:
                         continue
-                    if href not in visited and len(visited) + len(q) < max_pages * 2:
-                        q.append(href)
-        except Exception:
-            continue
+                    if href not in enqueued and len(enqueued) < max_pages * 2:
+                        enqueued.add(href)
+                        next_frontier.append(href)
+            frontier = next_frontier
     return results
 
 
-def write_csv(rows: List[Dict], path: str):
-    if not rows:
+def write_csv(rows: Iterable[PageRow], path: str) -> int:
+    # Satırlar üretildikçe yazılır; liste olarak tutulmaları gerekmez
+    it = iter(rows)
+    first = next(it, None)
+    if first is None:
         print("[!] Yazılacak veri yok")
-        return
-    fieldnames = list(rows[0].keys())
+        return 0
+    values = attrgetter(*PAGE_FIELDS)
+    count = 1
     with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+        w = csv.writer(f)
+        w.writerow(PAGE_FIELDS)
+        w.writerow(values(first))
+        for r in it:
+            w.writerow(values(r))
+            count += 1
+    return count
 
 
-def write_md_summary(rows: List[Dict], path: str, top_n: int = 20):
+def write_md_summary(rows: List[PageRow], path: str, top_n: int = 20):
     if not rows:
         return
-    issues = {
-        "no_title": [r for r in rows if not r["title"]],
-        "long_title": [r for r in rows if r["title_len"] > RECOMMENDED_TITLE[1]],
-        "short_title": [r for r in rows if 0 < r["title_len"] < RECOMMENDED_TITLE[0]],
-        "no_desc": [r for r in rows if not r["meta_desc"]],
-        "no_canonical": [r for r in rows if not r["canonical"]],
-        "bad_h1": [r for r in rows if r["h1_count"] != 1],
-        "img_alt_missing": [r for r in rows if r["img_missing_alt"] > 0],
-        "no_og": [r for r in rows if not r["open_graph"]],
-        "no_twitter": [r for r in rows if not r["twitter_card"]],
-        "no_jsonld": [r for r in rows if not r["jsonld_types"]],
-        "thin_content": [r for r in rows if r["word_count"] < 300],
-        "noindex": [r for r in rows if "noindex" in r["meta_robots"].lower()],
-    }
+    keys = (
+        "no_title", "long_title", "short_title", "no_desc", "no_canonical", "bad_h1",
+        "img_alt_missing", "no_og", "no_twitter", "no_jsonld", "thin_content", "noindex",
+    )
+    # Tek geçiş: her kategori için toplam sayı + rapora girecek ilk top_n örnek
+    issues: Dict[str, List[PageRow]] = {k: [] for k in keys}
+    counts: Counter = Counter()
+
+    def hit(key: str, r: PageRow):
+        counts[key] += 1
+        if len(issues[key]) < top_n:
+            issues[key].append(r)
+
+    title_min, title_max = RECOMMENDED_TITLE
+    for r in rows:
+        title_len = r.title_len
+        if not r.title:
+            hit("no_title", r)
+        if title_len > title_max:
+            hit("long_title", r)
+        if 0 < title_len < title_min:
+            hit("short_title", r)
+        if not r.meta_desc:
+            hit("no_desc", r)
+        if not r.canonical:
+            hit("no_canonical", r)
+        if r.h1_count != 1:
+            hit("bad_h1", r)
+        if r.img_missing_alt > 0:
+            hit("img_alt_missing", r)
+        if not r.open_graph:
+            hit("no_og", r)
+        if not r.twitter_card:
+            hit("no_twitter", r)
+        if not r.jsonld_types:
+            hit("no_jsonld", r)
+        if r.word_count < THIN_WORDS:
+            hit("thin_content", r)
+        if "noindex" in r.meta_robots.lower():
+            hit("noindex", r)
+
     total = len(rows)
     with open(path, "w", encoding="utf-8") as f:
         f.write(f"# SEO Denetim Özeti (Toplam Sayfa: {total})\n\n")
-        for key, items in issues.items():
-            if not items:
+        for key in keys:
+            n = counts[key]
+            if not n:
                 continue
             label = key.replace("_", " ").title()
-            f.write(f"## {label} — {len(items)} sayfa\n\n")
-            for r in items[:top_n]:
-                f.write(f"- {r['url']}\n")
-            if len(items) > top_n:
-                f.write(f"\n… ve {len(items) - top_n} daha.\n\n")
+            f.write(f"## {label} — {n} sayfa\n\n")
+            for r in issues[key]:
+                f.write(f"- {r.url}\n")
+            if n > top_n:
+                f.write(f"\n… ve {n - top_n} daha.\n\n")
         # En yavaş ilk 10
-        slow = sorted(rows, key=lambda r: r["resp_ms"], reverse=True)[:10]
+        slow = heapq.nlargest(10, rows, key=lambda r: r.resp_ms)
         f.write("\n## En Yavaş 10 Sayfa (ms)\n\n")
         for r in slow:
-            f.write(f"- {r['resp_ms']:>6} ms — {r['url']}\n")
+            f.write(f"- {r.resp_ms:>6} ms — {r.url}\n")
 
 
-def build_sitemap(urls: List[str]) -> str:
+def build_sitemap(urls: Iterable[str], out: TextIO) -> None:
+    # XML tek bir dizge olarak kurulmaz; girdiler doğrudan dosyaya yazılır
     from datetime import datetime
     now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    lines = [
-        "<?xml version=\"1.0\" encoding=\"UTF-8\"?>",
-        "<urlset xmlns=\"http://www.sitemaps.org/schemas/sitemap/0.9\">",
-    ]
-    uniq = list(dict.fromkeys(urls))
-    for u in uniq:
-        lines.append("  <url>")
-        lines.append(f"    <loc>{u}</loc>")
-        lines.append(f"    <lastmod>{now}</lastmod>")
-        lines.append("  </url>")
-    lines.append("</urlset>")
-    return "\n".join(lines)
+    out.write("<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n")
+    out.write("<urlset xmlns=\"http://www.sitemaps.org/schemas/sitemap/0.9\">\n")
+    seen: Set[str] = set()
+    for u in urls:
+        if u in seen:
+            continue
+        seen.add(u)
+        out.write(f"  <url>\n    <loc>{u}</loc>\n    <lastmod>{now}</lastmod>\n  </url>\n")
+    out.write("</urlset>")
+
+
+def empty_row(url: str, html: bytes, status: int, elapsed_ms: int, redirects: List[str]) -> PageRow:
+    return PageRow(
+        url=url,
+        status=status,
+        resp_ms=elapsed_ms,
+        redirects=" -> ".join(redirects) if redirects else "",
+        bytes_kb=round(len(html) / 1024.0, 1),
+    )
+
+
+# (url, html, status, elapsed_ms, redirects, is_page)
+ParseJob = Tuple[str, bytes, int, int, List[str], bool]
+
+
+def _parse_worker(job: ParseJob, parts: Optional[Dict] = None) -> PageRow:
+    # ProcessPoolExecutor içinde de çalışır; hata olursa boş satır döner
+    url, html, status, elapsed_ms, redirects, is_page = job
+    if not is_page:
+        # 200 olmayan ya da HTML olmayan yanıtlar ayrıştırılmaz
+        return empty_row(url, html, status, elapsed_ms, redirects)
+    try:
+        return parse_page(url, html, status, elapsed_ms, redirects, parts)
+    except Exception:
+        return empty_row(url, html, status, elapsed_ms, redirects)
+
+
+def _iter_rows(jobs: List[ParseJob], built: List[PageRow], from_crawl: bool) -> Iterator[PageRow]:
+    if from_crawl:
+        # crawl her yanıtın satırını tarama sırasında üretti (HTML olmayan/hatalı yanıtlar için boş satır)
+        yield from built
+    elif len(jobs) < PARSE_POOL_MIN_JOBS:
+        # Az sayfada süreç başlatma ve pickle maliyeti ayrıştırmadan fazladır
+        yield from map(_parse_worker, jobs)
+    else:
+        # HTML ayrıştırma CPU yoğun: sayfaları çekirdeklere dağıt
+        with ProcessPoolExecutor() as pe:
+            yield from pe.map(_parse_worker, jobs, chunksize=4)
+
+
+def _keep(rows: Iterable[PageRow], sink: List[PageRow]) -> Iterator[PageRow]:
+    for r in rows:
+        sink.append(r)
+        yield r
 
 
 def cmd_audit(args):
+    normalize_url.cache_clear()
     start = args.start
     urls_from_sitemap: List[str] = []
     if args.sitemap:
@@ -363,70 +759,53 @@ def cmd_audit(args):
     print(f"[i] Taranıyor: {start}")
 
     crawled = []
-    if urls_from_sitemap:
+    from_crawl = not urls_from_sitemap
+    if not from_crawl:
         print(f"[i] Sitemap'ten {len(urls_from_sitemap)} URL bulundu")
         # Sitemap URL'lerini GET edip parse edelim (max_pages sınırla)
         targets = urls_from_sitemap[: args.max_pages]
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
-            futs = {ex.submit(fetch, u): u for u in targets}
-            for fut in as_completed(futs):
-                resp, redirects, elapsed_ms = fut.result()
-                crawled.append((resp.url, resp, redirects, elapsed_ms))
+        if AIOHTTP_AVAILABLE:
+            import asyncio
+            for resp, redirects, elapsed_ms in asyncio.run(_afetch_all(targets)):
+                crawled.append((resp.url, resp, redirects, elapsed_ms, None))
+        else:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+                futs = {ex.submit(fetch, u): u for u in targets}
+                for fut in as_completed(futs):
+                    resp, redirects, elapsed_ms = fut.result()
+                    crawled.append((resp.url, resp, redirects, elapsed_ms, None))
     else:
         crawled = crawl(start, args.max_pages, same_site_only=not args.cross_domain)
 
-    rows: List[Dict] = []
-    for url, resp, redirects, elapsed_ms in crawled:
-        status = resp.status_code
-        html = resp.content if status == 200 else resp.content or b""
-        try:
-            row = parse_page(url, html, status, elapsed_ms, redirects)
-        except Exception:
-            row = {
-                "url": url,
-                "status": status,
-                "resp_ms": elapsed_ms,
-                "redirects": " -> ".join(redirects) if redirects else "",
-                "bytes_kb": round(len(html) / 1024.0, 1),
-                "title": "",
-                "title_len": 0,
-                "title_ok": False,
-                "meta_desc": "",
-                "meta_desc_len": 0,
-                "meta_desc_ok": False,
-                "meta_robots": "",
-                "canonical": "",
-                "self_canonical": False,
-                "h1_count": 0,
-                "h1_texts": "",
-                "h2_count": 0,
-                "h3_count": 0,
-                "h4_count": 0,
-                "h5_count": 0,
-                "h6_count": 0,
-                "img_total": 0,
-                "img_missing_alt": 0,
-                "links_internal": 0,
-                "links_external": 0,
-                "links_nofollow": 0,
-                "open_graph": False,
-                "twitter_card": False,
-                "hreflang_count": 0,
-                "jsonld_types": "",
-                "word_count": 0,
-            }
-        rows.append(row)
-
+    crawled_urls = [c[0] for c in crawled]
+    # crawl satırları hazır ve gövdeleri bırakılmış; ayrıştırma işi (ve gövde) yalnızca sitemap modunda tutulur
+    jobs: List[ParseJob] = []
+    built: List[PageRow] = []
+    if from_crawl:
+        built = [c[4] for c in crawled]
+    else:
+        jobs = [(url, resp.content or b"", resp.status_code, elapsed_ms, redirects,
+                 resp.status_code == 200 and _is_html(resp.headers))
+                for url, resp, redirects, elapsed_ms, _ in crawled]
+    del crawled
+
+    # Satırlar akış halinde CSV'ye yazılır; yalnızca Markdown rapor istenirse tutulur
+    rows: Iterable[PageRow] = _iter_rows(jobs, built, from_crawl)
+    md_rows: List[PageRow] = []
+    if args.md_out:
+        rows = _keep(rows, md_rows)
     if args.output:
         write_csv(rows, args.output)
         print(f"[✓] CSV yazıldı: {args.output}")
+    else:
+        for _ in rows:
+            pass
     if args.md_out:
-        write_md_summary(rows, args.md_out)
+        write_md_summary(md_rows, args.md_out)
         print(f"[✓] Markdown rapor yazıldı: {args.md_out}")
     if args.sitemap_out:
-        sm = build_sitemap([r[0] for r in crawled])
         with open(args.sitemap_out, "w", encoding="utf-8") as f:
-            f.write(sm)
+            build_sitemap(crawled_urls, f)
         print(f"[✓] sitemap.xml yazıldı: {args.sitemap_out}")
 
 
@@ -11,6 +11,8 @@ SEO Toolbox — GUI + CLI (Modern Metro Style)
 
 Kurulum
   pip install requests beautifulsoup4 lxml tldextract PySide6
+  (isteğe bağlı) pip install aiohttp orjson
+  (isteğe bağlı, parquet/feather çıktısı) pip install pyarrow
 
 GUI Çalıştırma
   python seo_toolbox_gui.py --gui
@@ -21,31 +23,53 @@ CLI Örnekleri
 
   python seo_toolbox_gui.py audit --sitemap https://www.example.com/sitemap.xml \
       --output audit.csv
+
+  python seo_toolbox_gui.py audit --start https://www.example.com --output-format parquet
 """
 
-import argparse
 import csv
+import gzip
+import heapq
 import json
+import os
 import re
 import sys
+import threading
 import time
-import tldextract
-from collections import deque, defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from html import unescape
-from typing import Dict, List, Optional, Set, Tuple
-from urllib.parse import urljoin, urlparse, urlunparse
+from collections import Counter, deque, defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import chain
+from operator import itemgetter
+from types import SimpleNamespace
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urljoin, urlparse, urlsplit, urlunparse
 from urllib import robotparser
+from xml.sax.saxutils import escape as xml_escape
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 
-# GUI gereksinimleri isteğe bağlı
+# Hızlı JSON çözücü isteğe bağlı; yoksa standart json kullanılır
 try:
-    from PySide6 import QtCore, QtWidgets, QtGui
-    PYSIDE_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except Exception:
-    PYSIDE_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Sitemap modu için eşzamansız HTTP isteğe bağlı; yalnızca gerektiğinde içe aktarılır
+AIOHTTP_AVAILABLE = find_spec("aiohttp") is not None
+
+# GUI gereksinimleri isteğe bağlı; PySide6 yalnızca --gui ile yüklenir (CLI açılışı Qt kütüphanelerini yüklemez)
+PYSIDE_AVAILABLE = find_spec("PySide6") is not None
+
+# Parquet/Feather çıktısı isteğe bağlı; pyarrow yalnızca bu biçimler seçildiğinde yüklenir
+PYARROW_AVAILABLE = find_spec("pyarrow") is not None
 
 HEADERS = {
     "User-Agent": (
@@ -56,152 +80,315 @@ HEADERS = {
 }
 TIMEOUT = 15
 MAX_WORKERS = 8
+ASYNC_CONCURRENCY = 32  # sitemap modunda eşzamanlı istek sınırı
+PER_HOST_LIMIT = 2  # aynı host'a eşzamanlı istek sınırı (nazik tarama); crawl(per_host_limit=...) ile yükseltilebilir
+MAX_BODY_BYTES = 4_000_000  # sayfa başına okunacak azami gövde boyutu
+CHUNK_SIZE = 65536
+# sitemaps.org sınırı dosya başına 50.000 URL / 50 MB (sıkıştırılmamış); parçalar sınıra pay bırakır
+SITEMAP_SHARD_SIZE = 49_000  # parça başına URL
+SITEMAP_SHARD_BYTES = 49 * 1024 * 1024  # parça başına sıkıştırılmamış bayt bütçesi
+
+# Tüm istekler tek oturumu paylaşır; keep-alive ile TCP/TLS el sıkışması tekrar edilmez
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.max_redirects = 10
+_SESSION.mount("http://", HTTPAdapter(pool_connections=MAX_WORKERS * 2, pool_maxsize=MAX_WORKERS * 4, max_retries=0))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=MAX_WORKERS * 2, pool_maxsize=MAX_WORKERS * 4, max_retries=0))
 
 RECOMMENDED_TITLE = (50, 60)  # yaklaşık karakter aralığı
 RECOMMENDED_DESC = (120, 160)
 THIN_WORDS = 300
 
+_UTF8_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+# parse_page XPath sorguları modül yüklenirken bir kez derlenir
+_XP_TITLE = etree.XPath("(//title)[1]")
+_XP_META_DESC = etree.XPath("//meta[translate(@name,'DESCRIPTION','description')='description']")
+_XP_META_ROBOTS = etree.XPath("//meta[translate(@name,'ROBTS','robts')='robots']")
+_XP_CANONICAL = etree.XPath("//link[contains(@rel,'canonical')]")
+_XP_HEADING_COUNTS = {f"h{lvl}": etree.XPath(f"count(//h{lvl})") for lvl in range(1, 7)}
+_XP_H1_FIRST5 = etree.XPath("(//h1)[position() <= 5]")
+_XP_IMG = etree.XPath("//img")
+_XP_LINKS = etree.XPath("//a[@href]")
+_XP_OG = etree.XPath("//meta[starts-with(translate(@property,'OG','og'),'og:')]")
+_XP_TWITTER = etree.XPath("//meta[starts-with(translate(@name,'TWIER','twier'),'twitter:')]")
+_XP_HREFLANG = etree.XPath("//link[contains(@rel,'alternate')][@hreflang]")
+_XP_JSONLD = etree.XPath("//script[contains(@type,'ld+json')]")
+_SKIP_TAGS = ("script", "style", "noscript", "template", "svg", "meta", "link")
+
+_RE_WS = re.compile(r"\s+")
+_RE_WORD = re.compile(r"[\wğüşöçıİĞÜŞÖÇ]+")
+
 # ---------------------
 # Yardımcılar
 # ---------------------
 
-def normalize_url(base: str, href: str) -> Optional[str]:
+def _fast_join(base: str, base_sn: str, href: str) -> str:
+    # Sık görülen mutlak ve kök-göreli linkler urljoin'e uğramaz; nokta segmentli yollar urljoin'e kalır
+    if "/." in href or "\t" in href or "\n" in href or "\r" in href:
+        return urljoin(base, href)
+    if href.startswith(("http://", "https://")):
+        return href
+    if href.startswith("//"):
+        return base_sn.partition(":")[0] + ":" + href
+    if href.startswith("/"):
+        return base_sn + href
+    return urljoin(base, href)
+
+
+def normalize_url(base: str, href: str, base_sn: Optional[str] = None) -> Optional[str]:
     if not href:
         return None
     href = href.strip()
     try:
-        url = urljoin(base, href)
-        parts = urlparse(url)
+        if base_sn is None:
+            b = urlsplit(base)
+            base_sn = f"{b.scheme}://{b.netloc}"
+        parts = urlsplit(_fast_join(base, base_sn, href))
         if not parts.scheme or not parts.netloc:
-            return None
-        url = urlunparse((parts.scheme, parts.netloc, parts.path or "/", "", parts.query, ""))
-        return url
+            # "//" gibi sınır durumlarında urljoin'in sonucu esas alınır
+            parts = urlsplit(urljoin(base, href))
+            if not parts.scheme or not parts.netloc:
+                return None
+        if ";" in parts.path:
+            # ;params kısmı eskisi gibi atılır
+            parts = urlparse(urljoin(base, href))
+            return urlunparse((parts.scheme, parts.netloc, parts.path or "/", "", parts.query, ""))
+        url = f"{parts.scheme}://{parts.netloc}{parts.path or '/'}"
+        return f"{url}?{parts.query}" if parts.query else url
     except Exception:
         return None
 
 
+@lru_cache(maxsize=1)
+def _tld_extractor():
+    # Süreç başına tek TLDExtract, ilk kullanımda kurulur; paketle gelen PSL kopyası kullanılır (ağ isteği yok)
+    import tldextract
+    return tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+
+@lru_cache(maxsize=100_000)
+def _reg(netloc: str) -> Tuple[str, str]:
+    e = _tld_extractor()(netloc)
+    return (e.domain, e.suffix)
+
+
 def same_domain(a: str, b: str) -> bool:
-    ea = tldextract.extract(a)
-    eb = tldextract.extract(b)
-    return (ea.domain, ea.suffix) == (eb.domain, eb.suffix)
+    return _reg(urlsplit(a).netloc) == _reg(urlsplit(b).netloc)
 
 
 def fetch(url: str) -> Tuple[requests.Response, List[str], float]:
-    session = requests.Session()
-    session.max_redirects = 10
     redirects = []
     t0 = time.time()
     try:
-        resp = session.get(url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=True)
+        resp = _SESSION.get(url, timeout=TIMEOUT, allow_redirects=True, stream=True)
+        try:
+            resp._content = _read_capped(resp)
+        finally:
+            resp.close()
         for h in resp.history:
             redirects.append(h.url)
         elapsed_ms = int((time.time() - t0) * 1000)
         return resp, redirects, elapsed_ms
     except Exception as e:
         elapsed_ms = int((time.time() - t0) * 1000)
-        dummy = requests.Response()
-        dummy.status_code = 0
-        dummy._content = str(e).encode("utf-8", errors="ignore")
-        dummy.url = url
-        return dummy, redirects, elapsed_ms
-
-
-def visible_text(soup: BeautifulSoup) -> str:
-    for tag in soup(["script", "style", "noscript", "template", "svg", "meta", "link"]):
-        tag.decompose()
-    text = soup.get_text(separator=" ")
-    text = unescape(text)
-    text = re.sub(r"\s+", " ", text)
+        return _error_response(url, e), redirects, elapsed_ms
+
+
+def _is_html(headers) -> bool:
+    return headers.get("Content-Type", "").lower().startswith("text/html")
+
+
+def _read_capped(resp: requests.Response) -> bytes:
+    # HTML olmayan gövdeler hiç okunmaz, HTML ise MAX_BODY_BYTES ile sınırlanır
+    if not _is_html(resp.headers):
+        return b""
+    chunks = []
+    total = 0
+    for c in resp.iter_content(CHUNK_SIZE):
+        chunks.append(c)
+        total += len(c)
+        if total > MAX_BODY_BYTES:
+            break
+    return b"".join(chunks)
+
+
+def _error_response(url: str, exc: Exception) -> requests.Response:
+    dummy = requests.Response()
+    dummy.status_code = 0
+    dummy._content = str(exc).encode("utf-8", errors="ignore")
+    dummy.url = url
+    return dummy
+
+
+async def afetch(client, url: str) -> Tuple[requests.Response, List[str], int]:
+    # fetch() ile aynı çıktıyı verir; aiohttp yanıtı requests.Response'a aktarılır
+    redirects = []
+    t0 = time.time()
+    try:
+        async with client.get(url, allow_redirects=True, max_redirects=10) as r:
+            chunks = []
+            total = 0
+            if _is_html(r.headers):
+                async for c in r.content.iter_chunked(CHUNK_SIZE):
+                    chunks.append(c)
+                    total += len(c)
+                    if total > MAX_BODY_BYTES:
+                        break
+            content = b"".join(chunks)
+            redirects = [str(h.url) for h in r.history]
+            resp = requests.Response()
+            resp.status_code = r.status
+            resp._content = content
+            resp.url = str(r.url)
+            resp.headers = CaseInsensitiveDict(r.headers)
+        elapsed_ms = int((time.time() - t0) * 1000)
+        return resp, redirects, elapsed_ms
+    except Exception as e:
+        elapsed_ms = int((time.time() - t0) * 1000)
+        return _error_response(url, e), redirects, elapsed_ms
+
+
+async def _afetch_all(urls: List[str]) -> List[Tuple[requests.Response, List[str], int]]:
+    # asyncio ve aiohttp yalnızca sitemap modunda gerekir; açılışta yüklenmez
+    import asyncio
+    import aiohttp
+    sem = asyncio.Semaphore(ASYNC_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=TIMEOUT)
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as client:
+        async def one(u: str):
+            async with sem:
+                return await afetch(client, u)
+        return await asyncio.gather(*(one(u) for u in urls))
+
+
+def parse_html(html: bytes):
+    # lxml boş belgede hata verir; boş gövde için boş bir iskelet kullanılır
+    if not html or not html.strip():
+        return lxml.html.document_fromstring("<html></html>")
+    # meta charset yoksa lxml latin-1 varsayar; geçerli UTF-8 ise açıkça UTF-8 ile ayrıştır
+    try:
+        html.decode("utf-8")
+    except UnicodeDecodeError:
+        return lxml.html.document_fromstring(html)
+    return lxml.html.document_fromstring(html, parser=_UTF8_PARSER)
+
+
+def visible_text(doc) -> str:
+    # Alt ağaçlar tek C geçişinde silinir; kuyruk metni korunur. lxml varlıkları zaten çözer (unescape gereksiz)
+    etree.strip_elements(doc, *_SKIP_TAGS, with_tail=False)
+    text = " ".join(doc.itertext())
+    text = _RE_WS.sub(" ", text)
     return text.strip()
 
 
-def extract_jsonld_types(soup: BeautifulSoup) -> List[str]:
+def _json_loads(text: str):
+    # orjson, standart json'un kabul ettiği NaN/Infinity gibi girdileri reddeder; o durumda json.loads denenir
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def extract_jsonld_types(doc) -> List[str]:
     types = []
-    for s in soup.find_all("script", type=lambda t: t and "ld+json" in t):
+    for s in _XP_JSONLD(doc):
         try:
-            data = json.loads(s.string or s.text or "{}")
-            def collect(d):
-                if isinstance(d, dict):
-                    t = d.get("@type")
-                    if isinstance(t, str):
-                        types.append(t)
-                    elif isinstance(t, list):
-                        types.extend([str(x) for x in t])
-                    for v in d.values():
-                        collect(v)
-                elif isinstance(d, list):
-                    for it in d:
-                        collect(it)
-            collect(data)
+            data = _json_loads(s.text or "{}")
         except Exception:
             continue
+        # Özyineleme yerine yığın; yalnızca dict/list düğümlerine inilir, sıra ön-sıralı (pre-order) korunur
+        stack = [data]
+        while stack:
+            d = stack.pop()
+            if isinstance(d, dict):
+                t = d.get("@type")
+                if isinstance(t, str):
+                    types.append(t)
+                elif isinstance(t, list):
+                    types.extend([str(x) for x in t])
+                stack.extend(reversed([v for v in d.values() if isinstance(v, (dict, list))]))
+            elif isinstance(d, list):
+                stack.extend(reversed([v for v in d if isinstance(v, (dict, list))]))
     uniq = list(dict.fromkeys([t.strip() for t in types if t]))
     return uniq[:10]
 
 
+def _char_pixels(ch: str) -> int:
+    if ch.isupper():
+        return 8
+    if ch in "il":
+        return 4
+    if ch in "MW@#%&":
+        return 10
+    return 7
+
+
+# ASCII başlıklar için bayt -> piksel tablosu; toplama bytes.translate + sum ile C tarafında yapılır
+_PIXEL_TABLE = bytes(_char_pixels(chr(b)) if b < 128 else 7 for b in range(256))
+
+
 def estimate_title_pixels(title: str) -> int:
     if not title:
         return 0
-    width = 0
-    for ch in title:
-        if ch.isupper():
-            width += 8
-        elif ch in "il":
-            width += 4
-        elif ch in "MW@#%&":
-            width += 10
-        else:
-            width += 7
-    return width
+    if title.isascii():
+        return sum(title.encode("ascii").translate(_PIXEL_TABLE))
+    # Türkçe vb. karakterler: isupper() Unicode'a göre değerlendirilmeli
+    return sum(map(_char_pixels, title))
+
+
+def _first_attr(nodes: list, attr: str) -> str:
+    return (nodes[0].get(attr) or "").strip() if nodes else ""
 
 
 def parse_page(url: str, html: bytes, status: int, elapsed_ms: int, redirects: List[str]) -> Dict:
-    soup = BeautifulSoup(html, "lxml")
-    title = (soup.title.string.strip() if soup.title and soup.title.string else "")
-    meta_desc_tag = soup.find("meta", attrs={"name": re.compile(r"^description$", re.I)})
-    meta_desc = meta_desc_tag.get("content", "").strip() if meta_desc_tag else ""
-    meta_robots_tag = soup.find("meta", attrs={"name": re.compile(r"^robots$", re.I)})
-    meta_robots = meta_robots_tag.get("content", "").strip() if meta_robots_tag else ""
-
-    canonical_tag = soup.find("link", rel=lambda v: v and "canonical" in v)
-    canonical = canonical_tag.get("href", "").strip() if canonical_tag else ""
+    return parse_page_from_doc(url, parse_html(html), len(html), status, elapsed_ms, redirects)
+
+
+def parse_page_from_doc(url: str, doc, size: int, status: int, elapsed_ms: int, redirects: List[str]) -> Dict:
+    # Not: visible_text ağaçtan script/style vb. düğümleri siler; link çıkarımı bundan önce yapılmalı
+    title_tag = _XP_TITLE(doc)
+    title = (title_tag[0].text or "").strip() if title_tag else ""
+    meta_desc = _first_attr(_XP_META_DESC(doc), "content")
+    meta_robots = _first_attr(_XP_META_ROBOTS(doc), "content")
+
+    canonical = _first_attr(_XP_CANONICAL(doc), "href")
     self_canonical = canonical.lower().rstrip("/") == url.lower().rstrip("/") if canonical else False
 
-    h_counts = {}
-    h_texts = {"h1": []}
-    for lvl in [1, 2, 3, 4, 5, 6]:
-        tags = soup.find_all(f"h{lvl}")
-        h_counts[f"h{lvl}"] = len(tags)
-        if lvl == 1:
-            h_texts["h1"] = [re.sub(r"\s+", " ", t.get_text(strip=True)) for t in tags]
+    # Sayımlar libxml2 içinde yapılır; metin yalnızca raporlanan ilk 5 h1 için çıkarılır
+    h_counts = {tag: int(xp(doc)) for tag, xp in _XP_HEADING_COUNTS.items()}
+    h_texts = {"h1": [_RE_WS.sub(" ", "".join(t.strip() for t in el.itertext())) for el in _XP_H1_FIRST5(doc)]}
 
-    imgs = soup.find_all("img")
+    imgs = _XP_IMG(doc)
     img_total = len(imgs)
     img_missing_alt = sum(1 for i in imgs if not i.get("alt"))
 
-    links = soup.find_all("a", href=True)
+    links = _XP_LINKS(doc)
     internal = external = nofollow = 0
+    page_parts = urlsplit(url)
+    page_reg = _reg(page_parts.netloc)
+    base_sn = f"{page_parts.scheme}://{page_parts.netloc}"
     for a in links:
-        href = normalize_url(url, a["href"]) or ""
+        href = normalize_url(url, a.get("href"), base_sn) or ""
         if not href:
             continue
-        if same_domain(url, href):
+        if _reg(urlsplit(href).netloc) == page_reg:
             internal += 1
         else:
             external += 1
-        rel = (a.get("rel") or [])
-        if isinstance(rel, list):
-            rel = " ".join(rel)
-        if "nofollow" in (rel or "").lower():
+        if "nofollow" in (a.get("rel") or "").lower():
             nofollow += 1
 
-    og_present = bool(soup.find("meta", property=re.compile(r"^og:", re.I)))
-    tw_present = bool(soup.find("meta", attrs={"name": re.compile(r"^twitter:", re.I)}))
-    hreflangs = [l.get("href") for l in soup.find_all("link", rel=lambda v: v and "alternate" in v, hreflang=True)]
-    jsonld_types = extract_jsonld_types(soup)
+    og_present = bool(_XP_OG(doc))
+    tw_present = bool(_XP_TWITTER(doc))
+    hreflangs = [l.get("href") for l in _XP_HREFLANG(doc)]
+    jsonld_types = extract_jsonld_types(doc)
 
-    text = visible_text(soup)
-    word_count = len(text.split())
+    text = visible_text(doc)
+    # visible_text boşlukları tek boşluğa indirger; kelime sayısı liste kurmadan sayılır
+    word_count = text.count(" ") + 1 if text else 0
 
     title_px = estimate_title_pixels(title)
 
@@ -210,7 +397,7 @@ def parse_page(url: str, html: bytes, status: int, elapsed_ms: int, redirects: L
         "status": status,
         "resp_ms": elapsed_ms,
         "redirects": " -> ".join(redirects) if redirects else "",
-        "bytes_kb": round(len(html) / 1024.0, 1),
+        "bytes_kb": round(size / 1024.0, 1),
         "title": title,
         "title_len": len(title),
         "title_px": title_px,
@@ -222,7 +409,7 @@ def parse_page(url: str, html: bytes, status: int, elapsed_ms: int, redirects: L
         "canonical": canonical,
         "self_canonical": self_canonical,
         "h1_count": h_counts.get("h1", 0),
-        "h1_texts": " | ".join(h_texts.get("h1", [])[:5]),
+        "h1_texts": " | ".join(h_texts.get("h1", [])),
         "h2_count": h_counts.get("h2", 0),
         "h3_count": h_counts.get("h3", 0),
         "h4_count": h_counts.get("h4", 0),
@@ -242,6 +429,7 @@ def parse_page(url: str, html: bytes, status: int, elapsed_ms: int, redirects: L
 
 
 def load_sitemap(url: str) -> List[str]:
+    from bs4 import BeautifulSoup
     try:
         r = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
         r.raise_for_status()
@@ -253,49 +441,149 @@ def load_sitemap(url: str) -> List[str]:
         return []
 
 
-def get_robots_parser(start_url: str) -> robotparser.RobotFileParser:
-    parts = urlparse(start_url)
-    robots_url = f"{parts.scheme}://{parts.netloc}/robots.txt"
-    rp = robotparser.RobotFileParser()
+# robots.txt her (scheme, netloc) için bir kez okunur; tarama ve RobotsTester aynı önbelleği kullanır.
+# Başarısız okumalar da saklanır (her şeyi reddeder), ancak kısa süre sonra yeniden denenir:
+# ulaşılamayan bir host için her kuyruk URL'i yeni bir engelleyici istek başlatmaz
+_RP_CACHE: Dict[Tuple[str, str], Tuple[robotparser.RobotFileParser, float]] = {}
+_RP_CACHE_MAX = 1024
+# GUI iş parçacığı ve tarama işçileri önbelleği birlikte kullanır: _RP_LOCK sözlükleri korur,
+# host kilidi aynı robots.txt'nin eşzamanlı ıskalamalarda bir kez çekilmesini sağlar
+_RP_LOCK = threading.Lock()
+_RP_HOST_LOCKS: Dict[Tuple[str, str], threading.Lock] = {}
+_RP_FAIL_TTL = 60.0  # saniye
+
+
+def _read_robots(rp: robotparser.RobotFileParser, url: str) -> bool:
+    # RobotFileParser.read() ile aynı kurallar; istek zaman aşımıyla ortak oturumdan yapılır
     try:
-        rp.set_url(robots_url)
-        rp.read()
+        resp = _SESSION.get(url, timeout=TIMEOUT)
     except Exception:
-        pass
+        return False
+    if resp.status_code in (401, 403):
+        rp.disallow_all = True
+    elif 400 <= resp.status_code < 500:
+        rp.allow_all = True
+    elif resp.status_code >= 500:
+        return False
+    else:
+        rp.parse(resp.content.decode("utf-8", errors="replace").splitlines())
+    return True
+
+
+def _rp_for(scheme: str, netloc: str) -> robotparser.RobotFileParser:
+    key = (scheme, netloc)
+    hit = _RP_CACHE.get(key)
+    if hit is not None and hit[1] > time.monotonic():
+        return hit[0]
+    with _RP_LOCK:
+        host_lock = _RP_HOST_LOCKS.setdefault(key, threading.Lock())
+    with host_lock:
+        # kilidi beklerken başka bir iş parçacığı okumayı bitirmiş olabilir
+        hit = _RP_CACHE.get(key)
+        if hit is not None and hit[1] > time.monotonic():
+            return hit[0]
+        rp = robotparser.RobotFileParser(f"{scheme}://{netloc}/robots.txt")
+        ok = _read_robots(rp, rp.url)
+        with _RP_LOCK:
+            if key not in _RP_CACHE and len(_RP_CACHE) >= _RP_CACHE_MAX:
+                old = next(iter(_RP_CACHE))
+                del _RP_CACHE[old]
+                _RP_HOST_LOCKS.pop(old, None)
+            _RP_CACHE[key] = (rp, float("inf") if ok else time.monotonic() + _RP_FAIL_TTL)
     return rp
 
 
-def crawl(start: str, max_pages: int, same_site_only: bool = True) -> List[Tuple[str, requests.Response, List[str], int]]:
-    visited: Set[str] = set()
-    q = deque([start])
-    rp = get_robots_parser(start)
-
-    results = []
-    while q and len(visited) < max_pages:
-        url = q.popleft()
-        if url in visited:
-            continue
-        visited.add(url)
+def get_robots_parser(start_url: str) -> robotparser.RobotFileParser:
+    parts = urlsplit(start_url)
+    return _rp_for(parts.scheme, parts.netloc)
 
-        # robots izin kontrolü
-        if not rp.can_fetch(HEADERS["User-Agent"], url):
-            continue
 
+def _crawl_page(url: str, start_reg: Tuple[str, str], same_site_only: bool) -> Tuple[requests.Response, List[str], int, Optional[Dict], List[str]]:
+    resp, redirects, elapsed_ms = fetch(url)
+    # İçerik türü gövde ayrıştırılmadan önce kontrol edilir; HTML olmayan yanıt için satır run_audit'te boş üretilir.
+    # HTML bir kez ayrıştırılır: aynı ağaçtan hem linkler (yalnızca 200) hem de satır çıkarılır
+    row = None
+    links: List[str] = []
+    if _is_html(resp.headers):
         try:
-            resp, redirects, elapsed_ms = fetch(url)
-            results.append((url, resp, redirects, elapsed_ms))
-            if resp.status_code == 200 and resp.headers.get("Content-Type", "").lower().startswith("text/html"):
-                soup = BeautifulSoup(resp.content, "lxml")
-                for a in soup.find_all("a", href=True):
-                    href = normalize_url(url, a["href"]) or ""
+            doc = parse_html(resp.content)
+            if resp.status_code == 200:
+                page_parts = urlsplit(url)
+                base_sn = f"{page_parts.scheme}://{page_parts.netloc}"
+                for a in _XP_LINKS(doc):
+                    href = normalize_url(url, a.get("href"), base_sn) or ""
                     if not href:
                         continue
-                    if same_site_only and not same_domain(start, href):
+                    if same_site_only and _reg(urlsplit(href).netloc) != start_reg:
                         continue
-                    if href not in visited and len(visited) + len(q) < max_pages * 2:
-                        q.append(href)
+                    links.append(href)
+            row = parse_page_from_doc(url, doc, len(resp.content), resp.status_code, elapsed_ms, redirects)
         except Exception:
-            continue
+            row = None
+    return resp, redirects, elapsed_ms, row, links
+
+
+def crawl(start: str, max_pages: int, same_site_only: bool = True, per_host_limit: int = PER_HOST_LIMIT) -> List[Tuple[str, requests.Response, List[str], int, Optional[Dict]]]:
+    visited: Set[str] = set()
+    # kuyruğa bir kez girmiş her URL; aynı nav linki sayfa sayfa tekrar kuyruğa eklenmez
+    queued: Set[str] = {start}
+    start_host = urlsplit(start).netloc
+    start_reg = _reg(start_host)
+
+    # Host başına kuyruk; "ready" yalnızca bekleyen URL'si olan ve sınırına ulaşmamış host'ları (sırayla) tutar.
+    # Sınırdaki bir host ana kuyruğu boşaltmadan atlanır.
+    host_q: Dict[str, deque] = defaultdict(deque)
+    host_q[start_host].append(start)
+    waiting = 1
+    ready = deque([start_host])
+    in_ready: Set[str] = {start_host}
+    per_host: Dict[str, int] = defaultdict(int)
+
+    results = []
+    inflight: Dict[Future, Tuple[str, str]] = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        while True:
+            while ready and len(inflight) < MAX_WORKERS and len(visited) < max_pages:
+                host = ready.popleft()
+                hq = host_q[host]
+                url = hq.popleft()
+                waiting -= 1
+                if url not in visited:
+                    visited.add(url)
+                    # robots izin kontrolü (host başına önbellekli)
+                    parts = urlsplit(url)
+                    if _rp_for(parts.scheme, host).can_fetch(HEADERS["User-Agent"], url):
+                        per_host[host] += 1
+                        inflight[ex.submit(_crawl_page, url, start_reg, same_site_only)] = (url, host)
+                if hq and per_host[host] < per_host_limit:
+                    ready.append(host)
+                else:
+                    in_ready.discard(host)
+            if not inflight:
+                break
+
+            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                url, host = inflight.pop(fut)
+                per_host[host] -= 1
+                if host_q[host] and host not in in_ready:
+                    in_ready.add(host)
+                    ready.append(host)
+                try:
+                    resp, redirects, elapsed_ms, row, links = fut.result()
+                except Exception:
+                    continue
+                for href in links:
+                    if href in queued or len(visited) + waiting >= max_pages * 2:
+                        continue
+                    queued.add(href)
+                    h = urlsplit(href).netloc
+                    host_q[h].append(href)
+                    waiting += 1
+                    if h not in in_ready and per_host[h] < per_host_limit:
+                        in_ready.add(h)
+                        ready.append(h)
+                results.append((url, resp, redirects, elapsed_ms, row))
     return results
 
 
@@ -308,24 +596,37 @@ def write_csv(rows: List[Dict], path: str):
         print("[!] Yazılacak veri yok")
         return
     fieldnames = list(rows[0].keys())
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+    # DictWriter yerine satır başına tek itemgetter çağrısı; büyük tampon yazma çağrılarını azaltır
+    getter = itemgetter(*fieldnames)
+    with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        w.writerows(map(getter, rows))
+
+
+def write_columnar(rows: List[Dict], path: str, fmt: str):
+    if not rows:
+        print("[!] Yazılacak veri yok")
+        return
+    import pyarrow as pa
+    table = pa.Table.from_pylist(rows)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        pq.write_table(table, path, compression="snappy", row_group_size=50_000)
+    else:
+        import pyarrow.feather as feather
+        feather.write_feather(table, path, compression="zstd")
 
 
 def collect_issues(rows: List[Dict]) -> Dict[str, List[Dict]]:
-    title_map = defaultdict(list)
-    desc_map = defaultdict(list)
-    for r in rows:
-        if r.get("title"):
-            title_map[r["title"].strip().lower()].append(r)
-        if r.get("meta_desc"):
-            desc_map[r["meta_desc"].strip().lower()].append(r)
+    # Anahtarlar bir kez normalize edilir; tekrar sayımı Counter ile, seçim tek geçişte yapılır
+    t_norm = [r["title"].strip().lower() if r.get("title") else None for r in rows]
+    d_norm = [r["meta_desc"].strip().lower() if r.get("meta_desc") else None for r in rows]
+    t_counts = Counter(k for k in t_norm if k)
+    d_counts = Counter(k for k in d_norm if k)
 
-    duplicates_title = [item for key, lst in title_map.items() if len(lst) > 1 for item in lst]
-    duplicates_desc = [item for key, lst in desc_map.items() if len(lst) > 1 for item in lst]
+    duplicates_title = [r for r, k in zip(rows, t_norm) if k and t_counts[k] > 1]
+    duplicates_desc = [r for r, k in zip(rows, d_norm) if k and d_counts[k] > 1]
 
     issues = {
         "no_title": [r for r in rows if not r["title"]],
@@ -352,52 +653,167 @@ def write_md_summary(rows: List[Dict], path: str, top_n: int = 20):
         return
     issues = collect_issues(rows)
     total = len(rows)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(f"# SEO Denetim Özeti (Toplam Sayfa: {total})\n\n")
-        for key, items in issues.items():
-            if not items:
-                continue
-            label = key.replace("_", " ").title()
-            f.write(f"## {label} — {len(items)} sayfa\n\n")
-            for r in items[:top_n]:
-                f.write(f"- {r['url']}\n")
-            if len(items) > top_n:
-                f.write(f"\n… ve {len(items) - top_n} daha.\n\n")
-        slow = sorted(rows, key=lambda r: r["resp_ms"], reverse=True)[:10]
-        f.write("\n## En Yavaş 10 Sayfa (ms)\n\n")
-        for r in slow:
-            f.write(f"- {r['resp_ms']:>6} ms — {r['url']}\n")
-
-
-def build_sitemap(urls: List[str]) -> str:
+    out = [f"# SEO Denetim Özeti (Toplam Sayfa: {total})\n\n"]
+    for key, items in issues.items():
+        if not items:
+            continue
+        label = key.replace("_", " ").title()
+        out.append(f"## {label} — {len(items)} sayfa\n\n")
+        out.extend(f"- {r['url']}\n" for r in items[:top_n])
+        if len(items) > top_n:
+            out.append(f"\n… ve {len(items) - top_n} daha.\n\n")
+    # collect_issues "slow" listesini zaten azalan sırada verir; 10'dan azsa yeniden sıralamak yerine nlargest
+    slow = issues["slow"][:10]
+    if len(slow) < 10:
+        slow = heapq.nlargest(10, rows, key=lambda r: r["resp_ms"])
+    out.append("\n## En Yavaş 10 Sayfa (ms)\n\n")
+    out.extend(f"- {r['resp_ms']:>6} ms — {r['url']}\n" for r in slow)
+    # Rapor bellekte hazır; bir kez kodlanıp ikili dosyaya yazılır (metin katmanı / satır sonu çevirisi yok).
+    # Tampon boyutunu aşan tek write, BufferedWriter tarafından kopyalanmadan ham dosyaya aktarılır
+    data = "".join(out).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+_SITEMAP_HEAD = b"<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<urlset xmlns=\"http://www.sitemaps.org/schemas/sitemap/0.9\">\n"
+_SITEMAP_TAIL = b"</urlset>"
+
+
+def _lastmod_now() -> str:
     from datetime import datetime
-    now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    lines = [
-        "<?xml version=\"1.0\" encoding=\"UTF-8\"?>",
-        "<urlset xmlns=\"http://www.sitemaps.org/schemas/sitemap/0.9\">",
-    ]
-    uniq = list(dict.fromkeys(urls))
-    for u in uniq:
-        lines.append("  <url>")
-        lines.append(f"    <loc>{u}</loc>")
-        lines.append(f"    <lastmod>{now}</lastmod>")
-        lines.append("  </url>")
-    lines.append("</urlset>")
-    return "\n".join(lines)
+    return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _sitemap_entry(u: str, now: str) -> bytes:
+    return f"  <url>\n    <loc>{xml_escape(u)}</loc>\n    <lastmod>{now}</lastmod>\n  </url>\n".encode("utf-8")
+
+
+@contextmanager
+def open_sitemap_out(path: str) -> Iterator[BinaryIO]:
+    # ".gz" uzantılı yollar gzip ile sıkıştırılır; sıkıştırıcı tamponlu ham dosyaya yazar
+    with open(path, "wb", buffering=1 << 20) as raw:
+        if path.endswith(".gz"):
+            with gzip.GzipFile(filename="", mode="wb", compresslevel=6, fileobj=raw) as gz:
+                yield gz
+        else:
+            yield raw
+
+
+def _shard_path(path: str, n: int) -> str:
+    # "out/sitemap.xml.gz" -> "out/sitemap-0001.xml.gz"
+    for ext in (".xml.gz", ".xml", ".gz"):
+        if path.endswith(ext):
+            return f"{path[:-len(ext)]}-{n:04d}{ext}"
+    return f"{path}-{n:04d}.xml"
+
+
+def _unique(urls: Iterable[str]) -> Iterator[str]:
+    seen: Set[str] = set()
+    for u in urls:
+        if u not in seen:
+            seen.add(u)
+            yield u
+
+
+def build_sitemap_stream(entries: Iterator[bytes], fp: BinaryIO) -> Optional[bytes]:
+    # XML tek bir dizge olarak kurulmaz; kodlanmış girdiler URL sayısı ve bayt bütçesi dolana kadar doğrudan
+    # ikili dosyaya yazılır. Sığmayan ilk girdi bir sonraki parça için döner (hepsi yazıldıysa None)
+    count = 0
+    size = len(_SITEMAP_HEAD) + len(_SITEMAP_TAIL)
+    fp.write(_SITEMAP_HEAD)
+    for entry in entries:
+        if count and (count >= SITEMAP_SHARD_SIZE or size + len(entry) > SITEMAP_SHARD_BYTES):
+            fp.write(_SITEMAP_TAIL)
+            return entry
+        fp.write(entry)
+        count += 1
+        size += len(entry)
+    fp.write(_SITEMAP_TAIL)
+    return None
+
+
+def write_sitemaps(urls: Iterable[str], path: str) -> List[str]:
+    # Girdiler tek tek kodlanıp o anki parçaya yazılır; bütçe dolunca yeni parça açılır (bellekte yalnızca parça adları).
+    # Tek parçaya sığan çıktı path'e taşınır; aksi halde path'e sitemap index yazılır
+    now = _lastmod_now()
+    uniq = _unique(urls)
+    first = next(uniq, None)
+    entries: Iterator[bytes] = (_sitemap_entry(u, now) for u in uniq)
+    pending = _sitemap_entry(first, now) if first is not None else None
+    shard_paths: List[str] = []
+    while True:
+        shard_path = _shard_path(path, len(shard_paths) + 1)
+        with open_sitemap_out(shard_path) as f:
+            pending = build_sitemap_stream(chain((pending,), entries) if pending is not None else entries, f)
+        shard_paths.append(shard_path)
+        if pending is None:
+            break
+    if len(shard_paths) == 1:
+        os.replace(shard_paths[0], path)
+        return [path]
+
+    # Index içindeki adresler, parçaların sitenin köküne yükleneceği varsayımıyla kurulur
+    parts = urlsplit(first)
+    root = f"{parts.scheme}://{parts.netloc}/"
+    with open_sitemap_out(path) as f:
+        f.write(b"<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n")
+        f.write(b"<sitemapindex xmlns=\"http://www.sitemaps.org/schemas/sitemap/0.9\">\n")
+        for shard_path in shard_paths:
+            loc = xml_escape(root + os.path.basename(shard_path))
+            f.write(f"  <sitemap>\n    <loc>{loc}</loc>\n    <lastmod>{now}</lastmod>\n  </sitemap>\n".encode("utf-8"))
+        f.write(b"</sitemapindex>")
+    return [path] + shard_paths
 
 
 def keyword_density(text: str, keyword: str) -> float:
     if not text or not keyword:
         return 0.0
-    words = re.findall(r"[\wğüşöçıİĞÜŞÖÇ]+", text.lower())
+    words = _RE_WORD.findall(text.lower())
     if not words:
         return 0.0
     total = len(words)
-    k = keyword.lower()
-    count = sum(1 for w in words if w == k)
+    # eşleşme sayımı list.count ile C tarafında yapılır
+    count = words.count(keyword.lower())
     return (count / max(total, 1)) * 100.0
 
 
+def _blank_row(url: str, status: int, elapsed_ms: int, redirects: List[str], size: int) -> Dict:
+    return {
+        "url": url,
+        "status": status,
+        "resp_ms": elapsed_ms,
+        "redirects": " -> ".join(redirects) if redirects else "",
+        "bytes_kb": round(size / 1024.0, 1),
+        "title": "",
+        "title_len": 0,
+        "title_px": 0,
+        "title_ok": False,
+        "meta_desc": "",
+        "meta_desc_len": 0,
+        "meta_desc_ok": False,
+        "meta_robots": "",
+        "canonical": "",
+        "self_canonical": False,
+        "h1_count": 0,
+        "h1_texts": "",
+        "h2_count": 0,
+        "h3_count": 0,
+        "h4_count": 0,
+        "h5_count": 0,
+        "h6_count": 0,
+        "img_total": 0,
+        "img_missing_alt": 0,
+        "links_internal": 0,
+        "links_external": 0,
+        "links_nofollow": 0,
+        "open_graph": False,
+        "twitter_card": False,
+        "hreflang_count": 0,
+        "jsonld_types": "",
+        "word_count": 0,
+    }
+
+
 # ---------------------
 # CLI akışı
 # ---------------------
@@ -414,80 +830,78 @@ def run_audit(start: Optional[str], sitemap: Optional[str], max_pages: int, cros
     crawled = []
     if urls_from_sitemap:
         targets = urls_from_sitemap[: max_pages]
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
-            futs = {ex.submit(fetch, u): u for u in targets}
-            for fut in as_completed(futs):
-                resp, redirects, elapsed_ms = fut.result()
-                crawled.append((resp.url, resp, redirects, elapsed_ms))
+        # aiohttp varsa tek olay döngüsünde çok sayıda istek; yoksa iş parçacığı havuzu
+        if AIOHTTP_AVAILABLE:
+            import asyncio
+            for resp, redirects, elapsed_ms in asyncio.run(_afetch_all(targets)):
+                crawled.append((resp.url, resp, redirects, elapsed_ms, None))
+        else:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+                futs = {ex.submit(fetch, u): u for u in targets}
+                for fut in as_completed(futs):
+                    resp, redirects, elapsed_ms = fut.result()
+                    crawled.append((resp.url, resp, redirects, elapsed_ms, None))
     else:
         crawled = crawl(start, max_pages, same_site_only=not cross_domain)
 
     rows: List[Dict] = []
     scanned_urls: List[str] = []
-    for url, resp, redirects, elapsed_ms in crawled:
+    from_crawl = not urls_from_sitemap
+    for url, resp, redirects, elapsed_ms, row in crawled:
         scanned_urls.append(url)
+        if row is not None:
+            # crawl satırı zaten üretti
+            rows.append(row)
+            continue
         status = resp.status_code
         html = resp.content if status == 200 else resp.content or b""
+        if from_crawl:
+            # crawl HTML'i zaten ayrıştırdı; satır yoksa (HTML değil/ayrıştırma hatası) yeniden denenmez
+            rows.append(_blank_row(url, status, elapsed_ms, redirects, len(html)))
+            continue
         try:
             row = parse_page(url, html, status, elapsed_ms, redirects)
         except Exception:
-            row = {
-                "url": url,
-                "status": status,
-                "resp_ms": elapsed_ms,
-                "redirects": " -> ".join(redirects) if redirects else "",
-                "bytes_kb": round(len(html) / 1024.0, 1),
-                "title": "",
-                "title_len": 0,
-                "title_px": 0,
-                "title_ok": False,
-                "meta_desc": "",
-                "meta_desc_len": 0,
-                "meta_desc_ok": False,
-                "meta_robots": "",
-                "canonical": "",
-                "self_canonical": False,
-                "h1_count": 0,
-                "h1_texts": "",
-                "h2_count": 0,
-                "h3_count": 0,
-                "h4_count": 0,
-                "h5_count": 0,
-                "h6_count": 0,
-                "img_total": 0,
-                "img_missing_alt": 0,
-                "links_internal": 0,
-                "links_external": 0,
-                "links_nofollow": 0,
-                "open_graph": False,
-                "twitter_card": False,
-                "hreflang_count": 0,
-                "jsonld_types": "",
-                "word_count": 0,
-            }
+            row = _blank_row(url, status, elapsed_ms, redirects, len(html))
         rows.append(row)
     return rows, scanned_urls
 
 
 def cmd_audit(args):
+    fmt = args.output_format
+    # pyarrow eksikse tarama başlamadan çıkılır
+    if fmt != "csv" and not PYARROW_AVAILABLE:
+        print(f"{fmt} çıktısı için pyarrow gerekli. 'pip install pyarrow' ile kurun.")
+        sys.exit(2)
+    output = args.output or f"audit.{fmt}"
     rows, crawled_urls = run_audit(args.start, args.sitemap, args.max_pages, args.cross_domain)
-    if args.output:
-        write_csv(rows, args.output)
-        print(f"[✓] CSV yazıldı: {args.output}")
+    if fmt == "csv":
+        write_csv(rows, output)
+        print(f"[✓] CSV yazıldı: {output}")
+    else:
+        write_columnar(rows, output, fmt)
+        print(f"[✓] {fmt.capitalize()} yazıldı: {output}")
     if args.md_out:
         write_md_summary(rows, args.md_out)
         print(f"[✓] Markdown rapor yazıldı: {args.md_out}")
     if args.sitemap_out:
-        sm = build_sitemap(crawled_urls)
-        with open(args.sitemap_out, "w", encoding="utf-8") as f:
-            f.write(sm)
-        print(f"[✓] sitemap.xml yazıldı: {args.sitemap_out}")
+        written = write_sitemaps(crawled_urls, args.sitemap_out)
+        if len(written) > 1:
+            print(f"[✓] sitemap index yazıldı: {args.sitemap_out} ({len(written) - 1} parça)")
+        else:
+            print(f"[✓] sitemap.xml yazıldı: {args.sitemap_out}")
 
 
 # ---------------------
 # GUI (Modern Metro Style)
 # ---------------------
-if PYSIDE_AVAILABLE:
+def _load_qt():
+    from PySide6 import QtCore, QtWidgets, QtGui
+    return QtCore, QtWidgets, QtGui
+
+
+def _build_main_window_cls(QtCore, QtWidgets, QtGui):
+    # GUI sınıfları yalnızca --gui istendiğinde, yüklenen Qt modülleriyle tanımlanır
     class Worker(QtCore.QObject):
         progress = QtCore.Signal(int)
         finished = QtCore.Signal(list, list)
@@ -556,40 +970,70 @@ if PYSIDE_AVAILABLE:
             super().__init__(text)
             self.setStyleSheet(f"background:{color}; color:#c9d1d9; padding:4px 8px; border-radius:8px;")
 
-    class ResultsTable(QtWidgets.QTableWidget):
+    class RowsModel(QtCore.QAbstractTableModel):
+        # Hücreler satır listesinden istendiğinde üretilir; satır başına QTableWidgetItem oluşturulmaz
+        _COLS = [
+            ("URL", lambda r: r.get("url", "")),
+            ("Status", lambda r: r.get("status", 0)),
+            ("ms", lambda r: r.get("resp_ms", 0)),
+            ("KB", lambda r: r.get("bytes_kb", 0.0)),
+            ("TitleLen", lambda r: r.get("title_len", 0)),
+            ("TitlePx", lambda r: r.get("title_px", 0)),
+            ("H1", lambda r: r.get("h1_count", 0)),
+            ("ImgAlt-", lambda r: r.get("img_missing_alt", 0)),
+            ("Int", lambda r: r.get("links_internal", 0)),
+            ("Ext", lambda r: r.get("links_external", 0)),
+            ("OG", lambda r: "✓" if r.get("open_graph") else "-"),
+            ("JSON-LD", lambda r: r.get("jsonld_types", "-") or "-"),
+        ]
+        _RIGHT = {1, 2, 3, 4, 5, 6, 7, 8, 9}
+
+        def __init__(self, rows: Optional[List[Dict]] = None):
+            super().__init__()
+            self._rows = rows or []
+
+        def set_rows(self, rows: List[Dict]):
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+
+        def rowCount(self, parent=QtCore.QModelIndex()):
+            return 0 if parent.isValid() else len(self._rows)
+
+        def columnCount(self, parent=QtCore.QModelIndex()):
+            return 0 if parent.isValid() else len(self._COLS)
+
+        def data(self, index, role=QtCore.Qt.DisplayRole):
+            if not index.isValid():
+                return None
+            if role == QtCore.Qt.DisplayRole:
+                return str(self._COLS[index.column()][1](self._rows[index.row()]))
+            if role == QtCore.Qt.TextAlignmentRole and index.column() in self._RIGHT:
+                return QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter
+            return None
+
+        def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+            if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+                return self._COLS[section][0]
+            return super().headerData(section, orientation, role)
+
+    class ResultsTable(QtWidgets.QTableView):
         def __init__(self):
-            super().__init__(0, 12)
-            headers = [
-                "URL", "Status", "ms", "KB", "TitleLen", "TitlePx", "H1", "ImgAlt-",
-                "Int", "Ext", "OG", "JSON-LD"
-            ]
-            self.setHorizontalHeaderLabels(headers)
+            super().__init__()
+            self._model = RowsModel()
+            self.setModel(self._model)
             self.horizontalHeader().setStretchLastSection(True)
             self.setAlternatingRowColors(True)
             self.setStyleSheet(
                 """
-                QTableWidget { background:#0d1117; color:#c9d1d9; gridline-color:#21262d; }
+                QTableView { background:#0d1117; color:#c9d1d9; gridline-color:#21262d; }
                 QHeaderView::section { background:#161b22; color:#c9d1d9; padding:6px; border:0; }
-                QTableWidget::item:selected { background:#1f6feb; color:white; }
+                QTableView::item:selected { background:#1f6feb; color:white; }
                 """
             )
 
         def load(self, rows: List[Dict]):
-            self.setRowCount(0)
-            for r in rows:
-                row = self.rowCount()
-                self.insertRow(row)
-                vals = [
-                    r.get("url", ""), r.get("status", 0), r.get("resp_ms", 0), r.get("bytes_kb", 0.0),
-                    r.get("title_len", 0), r.get("title_px", 0), r.get("h1_count", 0), r.get("img_missing_alt", 0),
-                    r.get("links_internal", 0), r.get("links_external", 0), "✓" if r.get("open_graph") else "-",
-                    r.get("jsonld_types", "-") or "-",
-                ]
-                for col, v in enumerate(vals):
-                    item = QtWidgets.QTableWidgetItem(str(v))
-                    if col in (1,2,3,4,5,6,7,8,9):
-                        item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-                    self.setItem(row, col, item)
+            self._model.set_rows(rows)
 
     class IssuesList(QtWidgets.QListWidget):
         def load(self, issues: Dict[str, List[Dict]]):
@@ -770,39 +1214,110 @@ if PYSIDE_AVAILABLE:
             if not self.scanned_urls:
                 self.statusBar().showMessage("Önce tarama yapın")
                 return
-            path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "sitemap.xml kaydet", "sitemap.xml", "XML (*.xml)")
+            path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "sitemap.xml kaydet", "sitemap.xml", "XML (*.xml);;Sıkıştırılmış XML (*.xml.gz)")
             if path:
-                sm = build_sitemap(self.scanned_urls)
-                with open(path, "w", encoding="utf-8") as f:
-                    f.write(sm)
-                self.statusBar().showMessage(f"Sitemap yazıldı: {path}")
+                written = write_sitemaps(self.scanned_urls, path)
+                if len(written) > 1:
+                    self.statusBar().showMessage(f"Sitemap index yazıldı: {path} ({len(written) - 1} parça)")
+                else:
+                    self.statusBar().showMessage(f"Sitemap yazıldı: {path}")
+
+    return MainWindow
 
 
 # ---------------------
 # main
 # ---------------------
 
-def main():
+OUTPUT_FORMATS = ("csv", "parquet", "feather")
+DEFAULT_MAX_PAGES = 200
+
+# "audit" bayrakları tek tabloda tanımlanır; hem argparse hem de argparse'sız hızlı yol buradan kurulur.
+# Hızlı yol yalnızca _FAST_KEYS anahtarlarını anlar; başka bir add_argument seçeneği eklenirse o bayrak argparse'a kalır
+_AUDIT_OPTIONS: Tuple[Tuple[str, Dict], ...] = (
+    ("--start", {"help": "Başlangıç URL'i (https://...)"}),
+    ("--sitemap", {"help": "Sitemap URL'i (https://.../sitemap.xml)"}),
+    ("--max-pages", {"type": int, "default": DEFAULT_MAX_PAGES, "help": "Maksimum sayfa sayısı"}),
+    ("--cross-domain", {"action": "store_true", "help": "Aynı domain kısıtını kaldır (önerilmez)"}),
+    ("--output", {"default": None, "help": "Çıktı yolu (varsayılan: audit.<biçim>)"}),
+    ("--output-format", {"choices": OUTPUT_FORMATS, "default": "csv", "help": "Tablo çıktı biçimi (parquet/feather için pyarrow gerekir)"}),
+    ("--md-out", {"default": None, "help": "Özet Markdown rapor yolu"}),
+    ("--sitemap-out", {"default": None, "help": "Taranan URL'lerden sitemap üret ve kaydet (.xml.gz ise sıkıştırılır)"}),
+)
+_FAST_KEYS = {"type", "default", "choices", "action", "help"}
+_AUDIT_FLAGS = {flag: (flag[2:].replace("-", "_"), kw) for flag, kw in _AUDIT_OPTIONS}
+
+
+def _fast_audit_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    # Yardım, bilinmeyen bayrak veya hatalı değerde None döner ve karar argparse'a kalır
+    ns = SimpleNamespace(gui=False, cmd="audit", func=cmd_audit)
+    for dest, kw in _AUDIT_FLAGS.values():
+        setattr(ns, dest, kw.get("default", False if kw.get("action") == "store_true" else None))
+    it = iter(argv)
+    for tok in it:
+        flag, eq, val = tok.partition("=")
+        spec = _AUDIT_FLAGS.get(flag)
+        if spec is None:
+            return None
+        dest, kw = spec
+        if not kw.keys() <= _FAST_KEYS:
+            return None
+        if kw.get("action") == "store_true":
+            if eq:
+                return None
+            setattr(ns, dest, True)
+            continue
+        if "action" in kw:
+            return None
+        if not eq:
+            val = next(it, None)
+            if val is None or val.startswith("-"):
+                return None
+        # argparse choices her değeri ayrı denetler; tekrarlanan bayrakta yalnızca sonuncuya bakmak yetmez
+        if "choices" in kw and val not in kw["choices"]:
+            return None
+        try:
+            setattr(ns, dest, kw.get("type", str)(val))
+        except ValueError:
+            return None
+    return ns
+
+
+def _build_parser():
+    import argparse
     p = argparse.ArgumentParser(description="SEO Toolbox — GUI + CLI on‑page denetim")
     p.add_argument("--gui", action="store_true", help="GUI'yi başlat")
 
     sub = p.add_subparsers(dest="cmd")
     a = sub.add_parser("audit", help="Siteyi tara ve SEO metriklerini CSV olarak çıkar")
-    a.add_argument("--start", help="Başlangıç URL'i (https://...)")
-    a.add_argument("--sitemap", help="Sitemap URL'i (https://.../sitemap.xml)")
-    a.add_argument("--max-pages", type=int, default=200, help="Maksimum sayfa sayısı")
-    a.add_argument("--cross-domain", action="store_true", help="Aynı domain kısıtını kaldır (önerilmez)")
-    a.add_argument("--output", default="audit.csv", help="CSV çıktı yolu")
-    a.add_argument("--md-out", default=None, help="Özet Markdown rapor yolu")
-    a.add_argument("--sitemap-out", default=None, help="Taranan URL'lerden sitemap üret ve kaydet")
+    for flag, kw in _AUDIT_OPTIONS:
+        a.add_argument(flag, **kw)
     a.set_defaults(func=cmd_audit)
+    return p
 
+
+def main():
+    # Sık kullanılan "audit" çağrısı argparse içe aktarılmadan/kurulmadan çalıştırılır
+    argv = sys.argv[1:]
+    if argv[:1] == ["audit"]:
+        ns = _fast_audit_args(argv[1:])
+        if ns is not None:
+            ns.func(ns)
+            return
+
+    p = _build_parser()
     args = p.parse_args()
 
     if args.gui:
-        if not PYSIDE_AVAILABLE:
+        # find_spec paketi bulsa da içe aktarma (eksik Qt kütüphaneleri vb.) başarısız olabilir
+        try:
+            if not PYSIDE_AVAILABLE:
+                raise ImportError("PySide6")
+            QtCore, QtWidgets, QtGui = _load_qt()
+        except ImportError:
             print("PySide6 kurulu değil. 'pip install PySide6' ile kurun.")
             sys.exit(2)
+        MainWindow = _build_main_window_cls(QtCore, QtWidgets, QtGui)
         app = QtWidgets.QApplication(sys.argv)
         app.setWindowIcon(QtGui.QIcon())
         win = MainWindow()
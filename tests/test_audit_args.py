@@ -0,0 +1,82 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from seo_toolbox_gui import _AUDIT_OPTIONS, _build_parser, _fast_audit_args  # noqa: E402
+
+
+def _argparse_ns(argv):
+    # argparse hata verirse (çıkış kodu 2) None döner
+    with contextlib.redirect_stderr(io.StringIO()), contextlib.redirect_stdout(io.StringIO()):
+        try:
+            return vars(_build_parser().parse_args(["audit"] + argv))
+        except SystemExit:
+            return None
+
+
+class FastAuditArgsParityTest(unittest.TestCase):
+    CASES = [
+        [],
+        ["--start", "https://example.com"],
+        ["--start=https://example.com", "--max-pages=5"],
+        ["--sitemap", "https://example.com/sitemap.xml", "--output", "out.csv"],
+        ["--start", "https://example.com", "--cross-domain", "--md-out", "r.md", "--sitemap-out", "s.xml.gz"],
+        ["--output-format", "parquet"],
+        ["--output-format=feather", "--output", "a.feather"],
+        ["--output-format", "foo"],
+        ["--output-format", "foo", "--output-format=csv"],
+        ["--output-format=csv", "--output-format", "foo"],
+        ["--start", "a", "--start", "b"],
+        ["--max-pages", "5", "--max-pages=7"],
+        ["--max-pages", "abc"],
+        ["--max-pages", "-5"],
+        ["--max-pages=-5"],
+        ["--start"],
+        ["--start", "--sitemap", "x"],
+        ["--start="],
+        ["--unknown", "x"],
+        ["--cross-domain=1"],
+        ["--max", "5"],
+        ["-h"],
+        ["extra"],
+    ]
+
+    def test_fast_path_matches_argparse(self):
+        for argv in self.CASES:
+            with self.subTest(argv=argv):
+                fast = _fast_audit_args(argv)
+                expected = _argparse_ns(argv)
+                if fast is None:
+                    # hızlı yol reddederse karar argparse'a kalır; kabul ettiği her şey argparse ile aynı olmalı
+                    continue
+                self.assertIsNotNone(expected, "hızlı yol argparse'ın reddettiği girdiyi kabul etti")
+                self.assertEqual(vars(fast), expected)
+
+    def test_every_table_flag_takes_fast_path(self):
+        # her bayrak tablodan türetilir; hızlı yolun anlamadığı bir seçenek eklenirse bu test bunu gösterir
+        for flag, kw in _AUDIT_OPTIONS:
+            if kw.get("action") == "store_true":
+                argv = [flag]
+            else:
+                argv = [flag, kw["choices"][-1] if "choices" in kw else "7"]
+            with self.subTest(flag=flag):
+                fast = _fast_audit_args(argv)
+                self.assertIsNotNone(fast)
+                self.assertEqual(vars(fast), _argparse_ns(argv))
+
+    def test_invalid_output_format_falls_back(self):
+        self.assertIsNone(_fast_audit_args(["--output-format", "foo", "--output-format=csv"]))
+        self.assertIsNone(_fast_audit_args(["--output-format=foo"]))
+
+    def test_common_invocations_take_fast_path(self):
+        for argv in (["--start", "https://example.com", "--max-pages", "10"], ["--max-pages=-5"]):
+            with self.subTest(argv=argv):
+                self.assertIsNotNone(_fast_audit_args(argv))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from collections import defaultdict
+from unittest import mock
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import seo_toolbox_gui as gui  # noqa: E402
+
+HOSTS = ("a.example.com", "b.example.com", "c.example.com")
+
+
+class _AllowAll:
+    def can_fetch(self, agent, url):
+        return True
+
+
+class _StubSite:
+    # Her sayfa üç host'a da yeni linkler verir; fetch eşzamanlılığı host başına kaydedilir
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = defaultdict(int)
+        self.peak = defaultdict(int)
+        self.fetched = []
+
+    def fetch(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:
+            self.fetched.append(url)
+            self.active[host] += 1
+            self.peak[host] = max(self.peak[host], self.active[host])
+        try:
+            time.sleep(self.delay)
+            n = len(self.fetched)
+            links = "".join(f'<a href="https://{h}/p{n}-{i}">x</a>' for i in range(3) for h in HOSTS)
+            resp = requests.Response()
+            resp.status_code = 200
+            resp.url = url
+            resp.headers = CaseInsensitiveDict({"Content-Type": "text/html; charset=utf-8"})
+            resp._content = f"<html><head><title>{url}</title></head><body>{links}</body></html>".encode()
+            return resp, [], 1
+        finally:
+            with self.lock:
+                self.active[host] -= 1
+
+
+class CrawlSchedulerTest(unittest.TestCase):
+    def crawl(self, max_pages, **kw):
+        site = _StubSite()
+        with mock.patch.object(gui, "fetch", site.fetch), \
+                mock.patch.object(gui, "_rp_for", lambda scheme, netloc: _AllowAll()):
+            results = gui.crawl(f"https://{HOSTS[0]}/", max_pages, **kw)
+        return site, results
+
+    def test_per_host_limit_holds(self):
+        site, _ = self.crawl(40)
+        self.assertEqual(set(site.peak), set(HOSTS))
+        for host in HOSTS:
+            self.assertLessEqual(site.peak[host], gui.PER_HOST_LIMIT, host)
+        # sınır yalnızca host başına; toplamda host'lar paralel çekilir
+        self.assertEqual(max(site.peak.values()), gui.PER_HOST_LIMIT)
+
+    def test_custom_per_host_limit(self):
+        site, _ = self.crawl(40, per_host_limit=1)
+        self.assertEqual(max(site.peak.values()), 1)
+
+    def test_stops_at_max_pages(self):
+        site, results = self.crawl(25)
+        self.assertEqual(len(site.fetched), 25)
+        self.assertEqual(len(results), 25)
+        urls = [r[0] for r in results]
+        self.assertEqual(len(set(urls)), 25)
+        self.assertTrue(all(r[4] is not None for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import sys
+import unittest
+from dataclasses import asdict
+from unittest import mock
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Ebs_seo_toolbox_console as console  # noqa: E402
+import seo_toolbox_gui as gui  # noqa: E402
+
+PAGE = (
+    "<html><head><title>Örnek başlık</title>"
+    '<meta name="Description" content="Açıklama metni">'
+    '<meta name="robots" content="index,follow">'
+    '<link rel="canonical" href="https://example.com/a/">'
+    '<meta property="og:title" content="x"><meta name="twitter:card" content="summary">'
+    '<link rel="alternate" hreflang="en" href="https://example.com/en/">'
+    '<script type="application/ld+json">{"@type": "Article", "author": {"@type": "Person"}}</script>'
+    "</head><body><h1>Bir  iki</h1><h2>a</h2><h2>b</h2><h3>c</h3>"
+    '<img src="a.png"><img src="b.png" alt="b">'
+    '<a href="/b">b</a><a href="https://other.org/" rel="nofollow">o</a><a href="#top">t</a>'
+    "<p>üç dört beş</p><script>var hidden = 1;</script></body></html>"
+).encode("utf-8")
+
+
+class ConsoleParserFallbackTest(unittest.TestCase):
+    @unittest.skipUnless(console.SELECTOLAX_AVAILABLE, "selectolax kurulu değil")
+    def test_bs4_matches_selectolax(self):
+        fast = console.parse_page("https://example.com/a/", PAGE, 200, 5, [])
+        with mock.patch.object(console, "SELECTOLAX_AVAILABLE", False):
+            slow = console.parse_page("https://example.com/a/", PAGE, 200, 5, [])
+        self.assertEqual(asdict(slow), asdict(fast))
+
+    @unittest.skipUnless(console.SELECTOLAX_AVAILABLE, "selectolax kurulu değil")
+    def test_bom_page_matches_bs4(self):
+        bom_page = b"\xef\xbb\xbf" + PAGE
+        fast = console.parse_page("https://example.com/a/", bom_page, 200, 5, [])
+        with mock.patch.object(console, "SELECTOLAX_AVAILABLE", False):
+            slow = console.parse_page("https://example.com/a/", bom_page, 200, 5, [])
+        self.assertEqual(asdict(slow), asdict(fast))
+        self.assertEqual(fast.word_count, console.parse_page("https://example.com/a/", PAGE, 200, 5, []).word_count)
+
+    def test_bs4_path(self):
+        with mock.patch.object(console, "SELECTOLAX_AVAILABLE", False):
+            row = console.parse_page("https://example.com/a/", PAGE, 200, 5, [])
+        self.assertEqual(row.title, "Örnek başlık")
+        self.assertEqual((row.h1_count, row.h2_count, row.h3_count), (1, 2, 1))
+        self.assertEqual((row.links_internal, row.links_external, row.links_nofollow), (2, 1, 1))
+        self.assertEqual(row.jsonld_types, "Article, Person")
+        self.assertTrue(row.self_canonical)
+
+
+class JsonFallbackTest(unittest.TestCase):
+    def test_std_json_without_orjson(self):
+        with mock.patch.object(gui, "ORJSON_AVAILABLE", False):
+            self.assertEqual(gui._json_loads('{"a": NaN}').keys(), {"a"})
+            self.assertEqual(gui.extract_jsonld_types(gui.parse_html(PAGE)), ["Article", "Person"])
+
+
+class ThreadPoolFallbackTest(unittest.TestCase):
+    def test_sitemap_mode_without_aiohttp(self):
+        urls = [f"https://example.com/p{i}" for i in range(5)]
+
+        def fetch(url):
+            resp = requests.Response()
+            resp.status_code = 200
+            resp.url = url
+            resp.headers = CaseInsensitiveDict({"Content-Type": "text/html"})
+            resp._content = PAGE
+            return resp, [], 1
+
+        with mock.patch.object(gui, "AIOHTTP_AVAILABLE", False), \
+                mock.patch.object(gui, "load_sitemap", lambda url: urls), \
+                mock.patch.object(gui, "fetch", fetch):
+            rows, scanned = gui.run_audit(None, "https://example.com/sitemap.xml", 10)
+        self.assertEqual(sorted(scanned), urls)
+        self.assertTrue(all(r["title"] == "Örnek başlık" for r in rows))
+
+
+if __name__ == "__main__":
+    unittest.main()
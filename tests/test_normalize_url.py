@@ -0,0 +1,58 @@
+import os
+import sys
+import unittest
+from urllib.parse import urljoin, urlparse, urlsplit, urlunparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from seo_toolbox_gui import normalize_url  # noqa: E402
+
+
+def reference(base, href):
+    # _fast_join öncesi uygulama: her link urljoin + urlparse + urlunparse'tan geçer
+    if not href:
+        return None
+    href = href.strip()
+    try:
+        parts = urlparse(urljoin(base, href))
+        if not parts.scheme or not parts.netloc:
+            return None
+        return urlunparse((parts.scheme, parts.netloc, parts.path or "/", "", parts.query, ""))
+    except Exception:
+        return None
+
+
+BASES = [
+    "https://example.com/",
+    "https://example.com/a/b/page.html?x=1#top",
+    "http://Example.COM:80/dir/",
+    "https://example.com:443/dir/sub",
+    "https://user:pw@example.com:8443/a;p?q=1",
+]
+
+HREFS = [
+    "", "   ", "page", "./page", "../up", "../../../../too-far", "a/./b/../c", ".", "..", "./", "/.hidden",
+    "/abs/path", "/", "//", "///x", "/abs?x=1&y=2", "/abs#frag", "/abs?x=1#frag", "?only=query", "#only-frag",
+    "rel?x=1#f", "//cdn.example.net/lib.js", "//CDN.Example.NET:8080/x?y#z", "//example.com",
+    "http://example.com", "https://example.com/x", "HTTP://EXAMPLE.COM/Upper", "https://Example.COM:443/",
+    "http://example.com:80/p", "https://other.org/a;params?q=1#f", "/path;params", "rel;params",
+    "mailto:info@example.com", "javascript:void(0)", "tel:+905551112233", "data:text/plain,hi", "ftp://ftp.example.com/f",
+    "  /trimmed  ", "/a\tb", "/a\nb", "/line\r\nbreak", "https://exa mple.com/sp ace", "/ünicode/ğ", "https://[::1]:8080/v6",
+    "https://[::1/bad", "http://", "https:", "https:/x", "//user@host/p", "/%2e%2e/enc", "a/b/",
+]
+
+
+class NormalizeUrlEquivalenceTest(unittest.TestCase):
+    def test_matches_urljoin_reference(self):
+        for base in BASES:
+            b = urlsplit(base)
+            base_sn = f"{b.scheme}://{b.netloc}"
+            for href in HREFS:
+                with self.subTest(base=base, href=href):
+                    expected = reference(base, href)
+                    self.assertEqual(normalize_url(base, href), expected)
+                    self.assertEqual(normalize_url(base, href, base_sn), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import seo_toolbox_gui as gui  # noqa: E402
+
+
+class RobotsFailTtlTest(unittest.TestCase):
+    def setUp(self):
+        gui._RP_CACHE.clear()
+        gui._RP_HOST_LOCKS.clear()
+        self.addCleanup(gui._RP_CACHE.clear)
+        self.addCleanup(gui._RP_HOST_LOCKS.clear)
+        self.now = 1000.0
+        self.calls = []
+        patches = (
+            mock.patch.object(gui._SESSION, "get", self.failing_get),
+            mock.patch.object(gui.time, "monotonic", lambda: self.now),
+        )
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def failing_get(self, url, **kw):
+        self.calls.append(url)
+        raise requests.ConnectionError("unreachable")
+
+    def test_failed_read_is_cached_until_ttl(self):
+        rp = gui._rp_for("https", "down.example.com")
+        self.assertEqual(self.calls, ["https://down.example.com/robots.txt"])
+        # okunamayan robots.txt her şeyi reddeder
+        self.assertFalse(rp.can_fetch(gui.HEADERS["User-Agent"], "https://down.example.com/x"))
+
+        self.now += gui._RP_FAIL_TTL - 1
+        self.assertIs(gui._rp_for("https", "down.example.com"), rp)
+        self.assertEqual(len(self.calls), 1)
+
+        self.now += 2
+        self.assertIsNot(gui._rp_for("https", "down.example.com"), rp)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_successful_read_is_not_refetched(self):
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = b"User-agent: *\nDisallow: /private\n"
+        with mock.patch.object(gui._SESSION, "get", lambda url, **kw: self.calls.append(url) or resp):
+            rp = gui._rp_for("https", "up.example.com")
+            self.now += gui._RP_FAIL_TTL * 10
+            self.assertIs(gui._rp_for("https", "up.example.com"), rp)
+        self.assertEqual(len(self.calls), 1)
+        self.assertFalse(rp.can_fetch(gui.HEADERS["User-Agent"], "https://up.example.com/private/a"))
+
+
+
+class RobotsConcurrencyTest(unittest.TestCase):
+    def setUp(self):
+        gui._RP_CACHE.clear()
+        gui._RP_HOST_LOCKS.clear()
+        self.addCleanup(gui._RP_CACHE.clear)
+        self.addCleanup(gui._RP_HOST_LOCKS.clear)
+
+    def test_concurrent_misses_fetch_once(self):
+        calls = []
+        calls_lock = threading.Lock()
+
+        def slow_get(url, **kw):
+            with calls_lock:
+                calls.append(url)
+            time.sleep(0.05)
+            raise requests.ConnectionError("unreachable")
+
+        start = threading.Barrier(8)
+        got = []
+
+        def worker():
+            start.wait()
+            got.append(gui._rp_for("https", "slow.example.com"))
+
+        with mock.patch.object(gui._SESSION, "get", slow_get):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(calls, ["https://slow.example.com/robots.txt"])
+        self.assertEqual(len(got), 8)
+        self.assertTrue(all(rp is got[0] for rp in got))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Ebs_seo_toolbox_console import iter_sitemap_locs  # noqa: E402
+
+
+class IterSitemapLocsTest(unittest.TestCase):
+    def test_unescaped_ampersand_does_not_drop_sitemap(self):
+        data = (
+            b'<?xml version="1.0" encoding="UTF-8"?>'
+            b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            b"<url><loc>https://example.com/a</loc></url>"
+            b"<url><loc>https://example.com/?cat=1&page=2</loc></url>"
+            b"<url><loc>https://example.com/b</loc><lastmod>2024-01-01</lastmod></url>"
+            b"</urlset>"
+        )
+        locs = list(iter_sitemap_locs(io.BytesIO(data)))
+        self.assertEqual(len(locs), 3)
+        self.assertEqual(locs[0], "https://example.com/a")
+        self.assertEqual(locs[2], "https://example.com/b")
+
+    def test_sitemap_index_without_namespace(self):
+        data = (
+            b"<sitemapindex>"
+            b"<sitemap><loc> https://example.com/s1.xml </loc></sitemap>"
+            b"<sitemap><loc>https://example.com/s2.xml</loc></sitemap>"
+            b"</sitemapindex>"
+        )
+        self.assertEqual(
+            list(iter_sitemap_locs(io.BytesIO(data))),
+            ["https://example.com/s1.xml", "https://example.com/s2.xml"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import gzip
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from lxml import etree
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import seo_toolbox_gui as gui  # noqa: E402
+
+NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+
+def _read(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        return f.read()
+
+
+def _locs(path):
+    return [el.text for el in etree.fromstring(_read(path)).iter(f"{NS}loc")]
+
+
+def _urls(n):
+    return [f"https://example.com/p/{i:06d}" for i in range(n)]
+
+
+class BuildSitemapStreamTest(unittest.TestCase):
+    def test_returns_first_entry_over_budget(self):
+        now = gui._lastmod_now()
+        entries = iter([gui._sitemap_entry(u, now) for u in _urls(5)])
+        buf = io.BytesIO()
+        with mock.patch.object(gui, "SITEMAP_SHARD_SIZE", 3):
+            rest = gui.build_sitemap_stream(entries, buf)
+        self.assertEqual(rest, gui._sitemap_entry(_urls(5)[3], now))
+        self.assertEqual([el.text for el in etree.fromstring(buf.getvalue()).iter(f"{NS}loc")], _urls(3))
+        # kalan girdiler tüketilmeden bırakılır
+        self.assertEqual(len(list(entries)), 1)
+
+    def test_exhausted_input_returns_none(self):
+        buf = io.BytesIO()
+        self.assertIsNone(gui.build_sitemap_stream(iter(()), buf))
+        self.assertEqual(buf.getvalue(), gui._SITEMAP_HEAD + gui._SITEMAP_TAIL)
+
+
+class WriteSitemapsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def test_single_file_at_url_limit(self):
+        urls = _urls(gui.SITEMAP_SHARD_SIZE)
+        out = self.path("sitemap.xml")
+        self.assertEqual(gui.write_sitemaps(urls + urls[:10], out), [out])
+        self.assertEqual(_locs(out), urls)
+        self.assertEqual(os.listdir(self.dir), ["sitemap.xml"])
+
+    def test_shards_on_url_count(self):
+        urls = _urls(gui.SITEMAP_SHARD_SIZE + 1)
+        out = self.path("sitemap.xml")
+        written = gui.write_sitemaps(urls, out)
+        self.assertEqual(written, [out, self.path("sitemap-0001.xml"), self.path("sitemap-0002.xml")])
+        first, second = _locs(written[1]), _locs(written[2])
+        self.assertEqual(len(first), gui.SITEMAP_SHARD_SIZE)
+        self.assertEqual(len(second), 1)
+        self.assertEqual(first + second, urls)
+
+    def test_shards_on_byte_budget(self):
+        urls = _urls(30)
+        entry = len(gui._sitemap_entry(urls[0], gui._lastmod_now()))
+        base = len(gui._SITEMAP_HEAD) + len(gui._SITEMAP_TAIL)
+        # bütçe tam 10 girdiye yetecek kadar; 11. girdi yeni parçaya geçmeli
+        with mock.patch.object(gui, "SITEMAP_SHARD_BYTES", base + 10 * entry):
+            written = gui.write_sitemaps(urls, self.path("sitemap.xml"))
+        shards = written[1:]
+        self.assertEqual([len(_locs(p)) for p in shards], [10, 10, 10])
+        for p in shards:
+            self.assertLessEqual(len(_read(p)), base + 10 * entry)
+
+    def test_empty_input_writes_empty_urlset(self):
+        out = self.path("sitemap.xml")
+        self.assertEqual(gui.write_sitemaps([], out), [out])
+        self.assertEqual(_locs(out), [])
+
+    def test_gzip_output(self):
+        urls = _urls(3) + ["https://example.com/?a=1&b=2"]
+        out = self.path("sitemap.xml.gz")
+        self.assertEqual(gui.write_sitemaps(urls, out), [out])
+        with open(out, "rb") as f:
+            self.assertEqual(f.read(2), b"\x1f\x8b")
+        self.assertEqual(_locs(out), urls)
+
+    def test_index_contents(self):
+        urls = _urls(5)
+        out = self.path("sitemap.xml.gz")
+        with mock.patch.object(gui, "SITEMAP_SHARD_SIZE", 2):
+            written = gui.write_sitemaps(urls, out)
+        self.assertEqual(written[1:], [self.path(f"sitemap-000{i}.xml.gz") for i in (1, 2, 3)])
+        root = etree.fromstring(_read(out))
+        self.assertEqual(root.tag, f"{NS}sitemapindex")
+        self.assertEqual(
+            _locs(out),
+            [f"https://example.com/sitemap-000{i}.xml.gz" for i in (1, 2, 3)],
+        )
+        self.assertEqual(len(root.findall(f"{NS}sitemap/{NS}lastmod")), 3)
+        self.assertEqual(sum((_locs(p) for p in written[1:]), []), urls)
+
+
+if __name__ == "__main__":
+    unittest.main()